@@ -21,6 +21,8 @@ __all__ = [
     "DepthFirstResearchPlan",
     "BreadthFirstResearchPlan",
     "PlanElement",
+    "validate_completed_tasks",
+    "validate_action_plan",
     
     # Query models
     "QueryComponents",
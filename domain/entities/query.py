@@ -1,17 +1,20 @@
-from pydantic import BaseModel
-from typing import List, Optional, Literal, Annotated
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Tuple, Literal
 
 
 class QueryComponents(BaseModel):
-    main_concepts: List[str] = Annotated[List[str], "List of main concepts in the query"]
-    key_entities: List[str] = Annotated[List[str], "List of key entities in the query"]
-    relationships: List[str] = Annotated[List[str], "List of relationships between the key entities"]
-    temporal_constraints: Optional[List[str]] = Annotated[Optional[List[str]], "List of temporal constraints on the query"]
-    important_features: List[str] = Annotated[List[str], "List of important features of the query"]
-    tools_needed: Optional[List[str]] = Annotated[Optional[List[str]], "List of tools needed to answer the query"]
-    other_details: Optional[str] = Annotated[Optional[str], "Other details about the query"]
+    # Read-only once analyzed; frozen with tuple fields so instances are hashable
+    model_config = ConfigDict(frozen=True)
+    
+    main_concepts: Tuple[str, ...] = Field(default=(), description="List of main concepts in the query")
+    key_entities: Tuple[str, ...] = Field(default=(), description="List of key entities in the query")
+    relationships: Tuple[str, ...] = Field(default=(), description="List of relationships between the key entities")
+    temporal_constraints: Optional[Tuple[str, ...]] = Field(default=None, description="List of temporal constraints on the query")
+    important_features: Tuple[str, ...] = Field(default=(), description="List of important features of the query")
+    tools_needed: Optional[Tuple[str, ...]] = Field(default=None, description="List of tools needed to answer the query")
+    other_details: Optional[str] = Field(default=None, description="Other details about the query")
 
 
 class QueryType(BaseModel):
     query_type: Literal["depth-first", "breadth-first", "straightforward"]
-    reasoning: str = Annotated[str, "a short explanation of why you chose this query type"]
\ No newline at end of file
+    reasoning: str = Field(description="a short explanation of why you chose this query type")
\ No newline at end of file
@@ -6,6 +6,7 @@ Provides event-driven architecture foundation for research workflows.
 # Base event infrastructure
 from .base import (
     DomainEvent,
+    EventPayload,
     EventBus,
     EventHandler,
     EventPriority,
@@ -78,6 +79,7 @@ from .handlers.langfuse_research_handlers import (
 __all__ = [
     # Base infrastructure
     "DomainEvent",
+    "EventPayload",
     "EventBus", 
     "EventHandler",
     "EventPriority",
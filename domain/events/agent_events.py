@@ -3,15 +3,14 @@ Agent-specific domain events for tracking agent operations, performance, and int
 These events provide detailed observability into agent execution patterns.
 """
 
-from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 from .base import DomainEvent
 
 
-@dataclass(frozen=True)
 class AgentExecutionStarted(DomainEvent):
     """Emitted when an agent begins execution."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, input_data: Dict[str, Any],
                  model: Optional[str] = None, estimated_duration: Optional[float] = None):
@@ -29,9 +28,9 @@ class AgentExecutionStarted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentExecutionCompleted(DomainEvent):
     """Emitted when an agent completes execution successfully."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, output_data: Dict[str, Any],
                  execution_duration: float, token_usage: Optional[Dict[str, int]] = None,
@@ -51,9 +50,9 @@ class AgentExecutionCompleted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentExecutionFailed(DomainEvent):
     """Emitted when an agent execution fails."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, error_message: str,
                  error_type: str, execution_duration: Optional[float] = None,
@@ -73,9 +72,9 @@ class AgentExecutionFailed(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentToolCallStarted(DomainEvent):
     """Emitted when an agent starts calling a tool."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, tool_name: str, tool_input: Dict[str, Any],
                  tool_metadata: Optional[Dict[str, Any]] = None):
@@ -92,9 +91,9 @@ class AgentToolCallStarted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentToolCallCompleted(DomainEvent):
     """Emitted when an agent completes a tool call successfully."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, tool_name: str, tool_output: Any,
                  execution_duration: float, tool_metadata: Optional[Dict[str, Any]] = None):
@@ -112,9 +111,9 @@ class AgentToolCallCompleted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentToolCallFailed(DomainEvent):
     """Emitted when an agent tool call fails."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, tool_name: str, error_message: str,
                  error_type: str, execution_duration: Optional[float] = None,
@@ -134,9 +133,9 @@ class AgentToolCallFailed(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentDecisionPoint(DomainEvent):
     """Emitted when an agent reaches a decision point in its execution."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, decision_type: str,
                  decision_context: Dict[str, Any], decision_options: List[str], selected_option: str,
@@ -157,9 +156,9 @@ class AgentDecisionPoint(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentIterationStarted(DomainEvent):
     """Emitted when an agent starts a new iteration of its task."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, iteration_number: int,
                  iteration_reason: str, previous_results: Optional[Dict[str, Any]] = None):
@@ -177,9 +176,9 @@ class AgentIterationStarted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentIterationCompleted(DomainEvent):
     """Emitted when an agent completes an iteration."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, iteration_number: int,
                  iteration_results: Dict[str, Any], iteration_duration: float,
@@ -199,9 +198,9 @@ class AgentIterationCompleted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentCollaborationStarted(DomainEvent):
     """Emitted when multiple agents begin collaborating on a task."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, collaboration_id: str, agent_ids: List[str],
                  collaboration_type: str, shared_context: Dict[str, Any], coordination_strategy: str):
@@ -219,9 +218,9 @@ class AgentCollaborationStarted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentCollaborationCompleted(DomainEvent):
     """Emitted when agent collaboration completes."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, collaboration_id: str, agent_ids: List[str],
                  collaboration_results: Dict[str, Any], collaboration_duration: float,
@@ -240,9 +239,9 @@ class AgentCollaborationCompleted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentPerformanceMetrics(DomainEvent):
     """Emitted periodically with agent performance metrics."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, metrics: Dict[str, Any],
                  collection_timestamp: datetime, metrics_period: float):
@@ -260,9 +259,9 @@ class AgentPerformanceMetrics(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentResourceUsage(DomainEvent):
     """Emitted when agent resource usage is tracked."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, resource_type: str,
                  usage_amount: float, usage_unit: str, timestamp: datetime,
@@ -283,15 +282,15 @@ class AgentResourceUsage(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentStateTransition(DomainEvent):
     """Emitted when an agent transitions between states."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, from_state: str,
                  to_state: str, transition_reason: str, state_data: Optional[Dict[str, Any]] = None,
                  timestamp: datetime = None):
         if timestamp is None:
-            timestamp = datetime.now()
+            timestamp = datetime.now(timezone.utc)
         super().__init__(
             aggregate_id=session_id,
             event_type="agent_state_transition",
@@ -308,9 +307,9 @@ class AgentStateTransition(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentFeedbackReceived(DomainEvent):
     """Emitted when an agent receives feedback (human or system)."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, feedback_type: str,
                  feedback_content: str, feedback_score: Optional[float] = None,
@@ -331,9 +330,9 @@ class AgentFeedbackReceived(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class AgentAdaptationTriggered(DomainEvent):
     """Emitted when an agent adapts its behavior based on feedback or conditions."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, agent_id: str, agent_type: str, adaptation_type: str,
                  adaptation_reason: str, adaptation_details: Dict[str, Any],
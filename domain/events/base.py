@@ -6,12 +6,17 @@ following Domain-Driven Design patterns.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Callable, Optional, Type, Union
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Callable, Optional, Tuple, Type, Union
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from uuid import UUID, uuid4
 from enum import Enum
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class EventPriority(Enum):
@@ -22,7 +27,7 @@ class EventPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventMetadata:
     """Metadata associated with domain events"""
     correlation_id: Optional[str] = None
@@ -31,10 +36,55 @@ class EventMetadata:
     session_id: Optional[str] = None
     source: Optional[str] = None  # Source system/component
     priority: EventPriority = EventPriority.NORMAL
-    tags: Dict[str, str] = field(default_factory=dict)
+    tags: Tuple[Tuple[str, str], ...] = ()  # (key, value) pairs; a handful at most
+    
+    def get_tag(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Look up a tag value by key"""
+        # Linear scan beats a dict lookup for the few tags an event carries
+        for tag_key, value in self.tags:
+            if tag_key == key:
+                return value
+        return default
+    
+    @classmethod
+    def for_session(
+        cls,
+        session_id: Optional[str],
+        source: str,
+        correlation_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        tags: Tuple[Tuple[str, str], ...] = ()
+    ) -> "EventMetadata":
+        """Metadata for an event emitted within a research session"""
+        # Positional construction skips keyword matching on every event
+        if not tags:
+            return cls(correlation_id, None, user_id, session_id, source)
+        return cls(correlation_id, None, user_id, session_id, source, EventPriority.NORMAL, tags)
 
 
-@dataclass(frozen=True)
+class EventPayload(Mapping):
+    """
+    Base class for typed event payloads.
+    
+    Subclasses are frozen, slotted dataclasses so handlers can read fields as
+    plain attributes. The Mapping interface keeps dict-style access
+    (payload["query"], payload.get("query")) working for existing consumers.
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)
+    
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
+
+@dataclass(frozen=True, slots=True)
 class DomainEvent(ABC):
     """
     Base class for all domain events.
@@ -45,10 +95,13 @@ class DomainEvent(ABC):
     aggregate_id: str  # ID of the aggregate that emitted this event
     event_type: str   # Type identifier for the event
     event_id: UUID = field(default_factory=uuid4)
-    timestamp: datetime = field(default_factory=lambda: datetime.utcnow())
+    timestamp: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     version: int = field(default=1)  # Event schema version
-    data: Dict[str, Any] = field(default_factory=dict)  # Event payload
+    data: Mapping[str, Any] = field(default_factory=dict)  # Event payload
     metadata: EventMetadata = field(default_factory=EventMetadata)
+    # Lazily formatted by timestamp_iso; slotted classes have no __dict__
+    # for functools.cached_property to cache into
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate event after initialization"""
@@ -57,11 +110,40 @@ class DomainEvent(ABC):
         if not self.event_type:
             raise ValueError("event_type is required")
     
+    def _init_session_event(
+        self,
+        aggregate_id: str,
+        event_type: str,
+        data: Mapping[str, Any],
+        session_id: Optional[str],
+        source: str,
+        correlation_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        tags: Tuple[Tuple[str, str], ...] = ()
+    ) -> None:
+        """Initialize a subclass event emitted within a research session"""
+        DomainEvent.__init__(
+            self,
+            aggregate_id,
+            event_type,
+            data=data,
+            metadata=EventMetadata.for_session(session_id, source, correlation_id, user_id, tags)
+        )
+    
     @property
     def event_name(self) -> str:
         """Human-readable event name"""
         return self.__class__.__name__
     
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO-8601 timestamp, formatted once per event"""
+        value = self._timestamp_iso
+        if value is None:
+            value = self.timestamp.isoformat()
+            object.__setattr__(self, "_timestamp_iso", value)
+        return value
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for serialization"""
         return {
@@ -69,9 +151,9 @@ class DomainEvent(ABC):
             "aggregate_id": self.aggregate_id,
             "event_type": self.event_type,
             "event_name": self.event_name,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "version": self.version,
-            "data": self.data,
+            "data": dict(self.data),
             "metadata": {
                 "correlation_id": self.metadata.correlation_id,
                 "causation_id": self.metadata.causation_id,
@@ -79,7 +161,7 @@ class DomainEvent(ABC):
                 "session_id": self.metadata.session_id,
                 "source": self.metadata.source,
                 "priority": self.metadata.priority.value,
-                "tags": self.metadata.tags
+                "tags": dict(self.metadata.tags)
             }
         }
 
@@ -91,6 +173,7 @@ class EventHandler(ABC):
     Event handlers contain the side effects that should occur when
     domain events are published.
     """
+    __slots__ = ()
     
     @abstractmethod
     async def handle(self, event: DomainEvent) -> None:
@@ -107,6 +190,22 @@ class EventHandler(ABC):
     def priority(self) -> EventPriority:
         """Priority for this handler (affects processing order)"""
         return EventPriority.NORMAL
+    
+    async def handle_batch(self, events: List[DomainEvent]) -> None:
+        """
+        Handle several events in one call.
+        
+        The default just awaits handle() per event; handlers with cheap
+        synchronous bookkeeping override it to process the whole batch in
+        one loop. A failing event does not stop the rest of the batch.
+        """
+        for event in events:
+            try:
+                await self.handle(event)
+            except Exception:
+                logger.exception(
+                    "Handler %s failed on %s", type(self).__name__, event.event_type
+                )
 
 
 class EventPublisher(ABC):
@@ -182,6 +281,9 @@ class InMemoryEventBus(EventBus):
     
     def __init__(self):
         self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = {}
+        # event type -> its handlers plus catch-all handlers, priority-sorted;
+        # rebuilt lazily after any subscription change
+        self._dispatch_table: Dict[Type[DomainEvent], Tuple[EventHandler, ...]] = {}
         self._running = False
     
     async def publish(self, event: DomainEvent) -> None:
@@ -189,29 +291,37 @@ class InMemoryEventBus(EventBus):
         if not self._running:
             raise RuntimeError("Event bus is not running")
         
-        event_type = type(event)
-        
-        # Get handlers for this specific event type
-        specific_handlers = self._handlers.get(event_type, [])
+        handlers = self._handlers_for(type(event))
         
-        # Also get handlers that handle all DomainEvent types
-        base_handlers = self._handlers.get(DomainEvent, [])
-        
-        # Combine all applicable handlers
-        all_handlers = specific_handlers + base_handlers
-        
-        if all_handlers:
-            # Sort handlers by priority
-            sorted_handlers = sorted(all_handlers, key=lambda h: h.priority.value, reverse=True)
-            
+        if handlers:
             # Execute handlers concurrently
-            tasks = [handler.handle(event) for handler in sorted_handlers]
+            tasks = [handler.handle(event) for handler in handlers]
             await asyncio.gather(*tasks, return_exceptions=True)
     
     async def publish_many(self, events: List[DomainEvent]) -> None:
-        """Publish multiple events"""
+        """Publish multiple events, handing each handler its events as one batch"""
+        if not self._running:
+            raise RuntimeError("Event bus is not running")
+        
+        # Group per handler, keeping each handler's events in publish order
+        batches: Dict[EventHandler, List[DomainEvent]] = {}
         for event in events:
-            await self.publish(event)
+            for handler in self._handlers_for(type(event)):
+                batches.setdefault(handler, []).append(event)
+        
+        if batches:
+            sorted_handlers = sorted(batches, key=lambda h: h.priority.value, reverse=True)
+            tasks = [handler.handle_batch(batches[handler]) for handler in sorted_handlers]
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _handlers_for(self, event_type: Type[DomainEvent]) -> Tuple[EventHandler, ...]:
+        """Handlers for an event type, highest priority first"""
+        handlers = self._dispatch_table.get(event_type)
+        if handlers is None:
+            all_handlers = self._handlers.get(event_type, []) + self._handlers.get(DomainEvent, [])
+            handlers = tuple(sorted(all_handlers, key=lambda h: h.priority.value, reverse=True))
+            self._dispatch_table[event_type] = handlers
+        return handlers
     
     def subscribe(self, handler: EventHandler) -> None:
         """Subscribe an event handler"""
@@ -219,6 +329,7 @@ class InMemoryEventBus(EventBus):
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        self._dispatch_table.clear()
     
     def unsubscribe(self, handler: EventHandler) -> None:
         """Unsubscribe an event handler"""
@@ -226,6 +337,7 @@ class InMemoryEventBus(EventBus):
         if event_type in self._handlers:
             try:
                 self._handlers[event_type].remove(handler)
+                self._dispatch_table.clear()
             except ValueError:
                 pass  # Handler wasn't subscribed
     
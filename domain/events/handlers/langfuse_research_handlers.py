@@ -5,12 +5,29 @@ These handlers leverage Langfuse's native decorators and spans for
 enhanced observability and automatic trace correlation.
 """
 
+import asyncio
 import logging
-from typing import Type, Dict, Any, Optional
+from collections import OrderedDict, deque
+from typing import Type, Dict, Any, Optional, Callable, Awaitable, Mapping
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from itertools import islice
+import heapq
+import uuid
 import os
+import random
+import statistics
+import sys
+import time
 
 from langfuse import Langfuse, observe
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from ..base import DomainEvent, EventHandler, EventPriority
 from ..research_events import (
     ResearchSessionStarted,
@@ -20,9 +37,280 @@ from ..research_events import (
     ResearchSessionCompleted,
     ResearchSessionCancelled
 )
+from .research_handlers import StatusIndex, _epoch_seconds, _format_epoch, _welford_update, _welford_variance
 
 logger = logging.getLogger(__name__)
 
+# Minimum delay between two metrics sends to Langfuse
+METRICS_FLUSH_DEBOUNCE_SECONDS = 2.0
+
+# Maximum number of Langfuse SDK calls waiting for the background worker
+LANGFUSE_QUEUE_MAXSIZE = 10_000
+
+# Most sessions the progress tracker keeps before evicting the least recent
+MAX_TRACKED_SESSIONS = 1000
+
+# Seconds a finished (completed or cancelled) session stays in the tracker
+SESSION_RETENTION_SECONDS = 86400
+
+# Most recent quality/efficiency scores kept by the metrics collector
+SCORE_WINDOW_SIZE = 1000
+
+# Rough in-memory footprint of one tracked dataset item, for statistics
+DATASET_ITEM_APPROX_BYTES = 512
+
+# Seconds a dataset item whose creation failed stays in the collector
+DATASET_ERROR_RETENTION_SECONDS = 3600
+
+# Seconds to wait for the deferred Langfuse connectivity check
+LANGFUSE_HEALTH_CHECK_TIMEOUT = 2.0
+
+# Queued calls are replayed in batches of up to LANGFUSE_FLUSH_AT calls, or
+# whatever has arrived within LANGFUSE_FLUSH_INTERVAL seconds of the first one
+LANGFUSE_FLUSH_AT = int(os.getenv("LANGFUSE_FLUSH_AT", "100"))
+LANGFUSE_FLUSH_INTERVAL = float(os.getenv("LANGFUSE_FLUSH_INTERVAL", "5"))
+
+# Fraction of research sessions that get a Langfuse dataset item
+LANGFUSE_DATASET_SAMPLE_RATE = float(os.getenv("LANGFUSE_DATASET_SAMPLE_RATE", "1.0"))
+
+# Trace tags, shared across events instead of rebuilt per call
+_TAGS_START = ("research", "session_start")
+_TAGS_COMPLETE = ("research", "session_complete", "success")
+_TAGS_CANCELLED = ("research", "session_cancelled")
+
+
+def _to_ns(seconds: Optional[float]) -> int:
+    """Convert a duration in seconds to integer nanoseconds"""
+    return int((seconds or 0) * 1_000_000_000)
+
+
+def _trunc(s: Optional[str], n: int, default: str) -> str:
+    """Truncate s to n characters with an ellipsis, falling back to default"""
+    s = s or default
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def _to_json_ready(obj: Any) -> Any:
+    """
+    Normalize a Langfuse payload to plain JSON primitives in one walk.
+    
+    datetimes become epoch floats, UUIDs strings and tuples lists; None values
+    are dropped from dicts and empty dicts become None.
+    """
+    if isinstance(obj, Mapping):
+        out = {}
+        for key, value in obj.items():
+            value = _to_json_ready(value)
+            if value is not None:
+                out[key] = value
+        return out or None
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_ready(item) for item in obj]
+    if isinstance(obj, datetime):
+        return obj.timestamp()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return obj
+
+
+@lru_cache(maxsize=1)
+def _get_langfuse() -> Optional[Langfuse]:
+    """
+    Return the process-wide Langfuse client, or None if it is unavailable.
+    
+    Shared by all handlers so they use one HTTP session, connection pool and
+    set of background flush threads. Connectivity is verified later, off the
+    event loop, by _check_langfuse_connection.
+    """
+    try:
+        # Initialize Langfuse client with proper configuration
+        if os.getenv("LANGFUSE_HOST"):
+            logger.info("Initializing Langfuse client for: %s", os.getenv('LANGFUSE_HOST'))
+        else:
+            logger.info("Initializing Langfuse client for cloud instance")
+        
+        return Langfuse()
+    
+    except Exception as e:
+        logger.error("Failed to initialize Langfuse client: %s", e)
+        return None
+
+
+async def _check_langfuse_connection(client: Langfuse) -> bool:
+    """Run the client's auth check in a worker thread; True if it passes"""
+    try:
+        authenticated = await asyncio.wait_for(
+            asyncio.to_thread(client.auth_check),
+            timeout=LANGFUSE_HEALTH_CHECK_TIMEOUT
+        )
+    except Exception as e:
+        logger.error("❌ Failed to connect to Langfuse: %s", e)
+        return False
+    if not authenticated:
+        logger.error("❌ Failed to connect to Langfuse: auth check failed")
+        return False
+    logger.info("✅ Langfuse client connected successfully")
+    return True
+
+
+def _call_langfuse(client: Langfuse, method: str, **kwargs: Any) -> None:
+    """
+    Call a Langfuse client method inline, logging failures instead of raising.
+    
+    Used for current trace/span updates and scores, which only record data
+    on the active observation and hand off to the SDK's own export threads.
+    They must run before the handler's observation ends, so they are never
+    queued.
+    """
+    try:
+        getattr(client, method)(**(_to_json_ready(kwargs) or {}))
+    except Exception as e:
+        logger.error("Langfuse %s call failed: %s", method, e)
+
+
+class _LangfuseCallQueue:
+    """
+    Runs network-bound Langfuse SDK calls on a background worker task.
+    
+    Handlers submit calls such as dataset item writes, or just request a
+    flush after updating their observation, and return immediately. The
+    worker runs each call in order on the default executor as soon as it is
+    dequeued, so SDK HTTP I/O never blocks the event loop. Only the client
+    flush is batched: it runs once per flush_at submissions or flush_interval
+    seconds, whichever comes first. Calls that depend on the current
+    observation must not be queued; see _call_langfuse. When the queue is
+    full the oldest call is dropped and counted in dropped_spans.
+    """
+    
+    def __init__(
+        self,
+        client: Optional[Langfuse],
+        maxsize: int = LANGFUSE_QUEUE_MAXSIZE,
+        flush_at: int = LANGFUSE_FLUSH_AT,
+        flush_interval: float = LANGFUSE_FLUSH_INTERVAL
+    ):
+        self._client = client
+        self._maxsize = maxsize
+        self._flush_at = flush_at
+        self._flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.dropped_spans = 0
+    
+    def submit(self, method: str, **kwargs: Any) -> None:
+        """Queue a call to the given Langfuse client method"""
+        self._put((method, kwargs))
+    
+    def request_flush(self) -> None:
+        """Count towards the next batched client flush without queuing a call"""
+        self._put(None)
+    
+    def disable(self) -> None:
+        """Stop sending calls, e.g. after a failed connectivity check"""
+        self._client = None
+    
+    def _put(self, item: Optional[tuple]) -> None:
+        if self._client is None:
+            return
+        if self._queue is None:
+            # Started lazily so the queue binds to the running loop
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+            self._worker = asyncio.create_task(self._run())
+        
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped_spans += 1
+            self._queue.put_nowait(item)
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            deadline = loop.time() + self._flush_interval
+            pending = 0
+            while True:
+                try:
+                    if item is not None:
+                        await loop.run_in_executor(None, self._call, item)
+                finally:
+                    self._queue.task_done()
+                pending += 1
+                timeout = deadline - loop.time()
+                if pending >= self._flush_at or timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            
+            await loop.run_in_executor(None, self._flush)
+    
+    def _call(self, item: tuple) -> None:
+        """Run one queued call"""
+        if self._client is not None:
+            method, kwargs = item
+            _call_langfuse(self._client, method, **kwargs)
+    
+    def _flush(self) -> None:
+        """Flush the client once for everything submitted since the last flush"""
+        if self._client is None:
+            return
+        try:
+            self._client.flush()
+        except Exception as e:
+            logger.error("Langfuse flush failed: %s", e)
+
+
+@dataclass(slots=True)
+class TaskProgress:
+    """Progress of a single research task within a session"""
+    status: str
+    started_at: datetime
+    description: Optional[str] = None
+    estimated_tool_calls: Optional[int] = None
+    actual_tool_calls: Optional[int] = 0
+    sources_found: Optional[int] = 0
+    completed_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+    output_length: Optional[int] = None
+    failed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    error_type: Optional[str] = None
+    retry_count: int = 0
+
+
+@dataclass(slots=True)
+class SessionMetrics:
+    """Running totals accumulated from completed tasks"""
+    total_tool_calls: int = 0
+    total_duration_ns: int = 0  # integer nanoseconds across tasks
+    sources_analyzed: int = 0
+
+
+@dataclass(slots=True)
+class SessionProgress:
+    """Progress of a research session as tracked by LangfuseResearchProgressTracker"""
+    status: str
+    started_at: datetime
+    query: Optional[str] = None
+    project_id: Optional[str] = None
+    estimated_duration: Optional[int] = None
+    tasks: Dict[str, TaskProgress] = field(default_factory=dict)
+    total_tasks: int = 0
+    completed_tasks: int = 0
+    failed_tasks: int = 0
+    metrics: SessionMetrics = field(default_factory=SessionMetrics)
+    completed_at: Optional[datetime] = None
+    total_duration_seconds: Optional[float] = None
+    final_report_length: Optional[int] = None
+    total_tool_calls: Optional[int] = None
+    success_rate: float = 0.0
+    cancelled_at: Optional[datetime] = None
+    cancellation_reason: Optional[str] = None
+
 
 class LangfuseResearchProgressTracker(EventHandler):
     """
@@ -32,342 +320,387 @@ class LangfuseResearchProgressTracker(EventHandler):
     providing rich observability in the Langfuse UI.
     """
     
+    __slots__ = (
+        "_session_progress", "_version", "_snapshot", "_snapshot_version",
+        "_langfuse_client", "_lf_calls", "_health_task", "_dispatch"
+    )
+    
     def __init__(self):
-        self._session_progress: Dict[str, Dict[str, Any]] = {}
-        try:
-            # Initialize Langfuse client with proper configuration
-            if os.getenv("LANGFUSE_HOST"):
-                logger.info(f"Initializing Langfuse client for: {os.getenv('LANGFUSE_HOST')}")
-            else:
-                logger.info("Initializing Langfuse client for cloud instance")
-            
-            self._langfuse_client = Langfuse()
-            
-            # Test the connection
-            try:
-                test_response = self._langfuse_client.get_project()
-                logger.info(f"✅ Langfuse client connected successfully")
-            except Exception as e:
-                logger.error(f"❌ Failed to connect to Langfuse: {e}")
-                self._langfuse_client = None
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize Langfuse client: {e}")
-            self._langfuse_client = None
+        # Least recently updated sessions first; bounded by MAX_TRACKED_SESSIONS
+        self._session_progress: OrderedDict[str, SessionProgress] = OrderedDict()
+        # Cached get_all_sessions() result, invalidated by bumping _version
+        self._version = 0
+        self._snapshot: Optional[Mapping[str, Dict[str, Any]]] = None
+        self._snapshot_version = -1
+        self._langfuse_client = _get_langfuse()
+        self._lf_calls = _LangfuseCallQueue(self._langfuse_client)
+        # Kept so the one-off connectivity check is not garbage-collected
+        self._health_task: Optional[asyncio.Task] = None
+        self._dispatch: Dict[type, Callable[[Any], Awaitable[None]]] = {
+            ResearchSessionStarted: self._handle_session_started,
+            ResearchTaskStarted: self._handle_task_started,
+            ResearchTaskCompleted: self._handle_task_completed,
+            ResearchTaskFailed: self._handle_task_failed,
+            ResearchSessionCompleted: self._handle_session_completed,
+            ResearchSessionCancelled: self._handle_session_cancelled
+        }
         
     @observe(name="research_event_handler")
     async def handle(self, event: DomainEvent) -> None:
         """Handle research progress events with Langfuse tracing"""
-        session_id = event.metadata.session_id
+        meta = event.metadata
+        if self._health_task is None and self._langfuse_client:
+            self._health_task = asyncio.create_task(self._verify_langfuse())
+        
+        session_id = meta.session_id
         
         # Update current trace with event context
         if self._langfuse_client:
-            self._langfuse_client.update_current_trace(
-                name=f"Research {event.event_name}",
+            _call_langfuse(
+                self._langfuse_client,
+                "update_current_trace",
+                name=sys.intern(f"Research {event.event_name}"),
                 session_id=session_id,
-                user_id=event.metadata.user_id,
+                user_id=meta.user_id,
                 metadata={
                     "event_type": event.event_type,
                     "aggregate_id": event.aggregate_id,
-                    "correlation_id": event.metadata.correlation_id,
-                    "source": event.metadata.source
+                    "correlation_id": meta.correlation_id,
+                    "source": meta.source
                 }
             )
         
         # Handle specific event types
-        match event:
-            case ResearchSessionStarted():
-                await self._handle_session_started(event)
-            case ResearchTaskStarted():
-                await self._handle_task_started(event)
-            case ResearchTaskCompleted():
-                await self._handle_task_completed(event)
-            case ResearchTaskFailed():
-                await self._handle_task_failed(event)
-            case ResearchSessionCompleted():
-                await self._handle_session_completed(event)
-            case ResearchSessionCancelled():
-                await self._handle_session_cancelled(event)
-                await self._mark_session_cancelled(event)
-    
-    @observe(name="session_started")
+        handler = self._dispatch.get(type(event))
+        if handler is not None:
+            await handler(event)
+        
+        # Exporting is batched; the updates above are already recorded
+        self._lf_calls.request_flush()
+    
+    async def _verify_langfuse(self) -> None:
+        """Disable Langfuse emission if the backend turns out to be unreachable"""
+        if not await _check_langfuse_connection(self._langfuse_client):
+            self._langfuse_client = None
+            self._lf_calls.disable()
+    
     async def _handle_session_started(self, event: ResearchSessionStarted) -> None:
         """Initialize progress tracking for a new session with Langfuse trace"""
-        session_id = event.metadata.session_id
+        data = event.data
+        meta = event.metadata
+        session_id = meta.session_id
         
         # Create comprehensive session progress
-        self._session_progress[session_id] = {
-            "status": "in_progress",
-            "started_at": event.timestamp,
-            "query": event.data.get("query"),
-            "project_id": event.data.get("project_id"),
-            "estimated_duration": event.data.get("estimated_duration_minutes"),
-            "tasks": {},
-            "total_tasks": 0,
-            "completed_tasks": 0,
-            "failed_tasks": 0,
-            "metrics": {
-                "total_tool_calls": 0,
-                "total_duration": 0.0,
-                "sources_analyzed": 0
-            }
-        }
+        self._session_progress[session_id] = SessionProgress(
+            status="in_progress",
+            started_at=event.timestamp,
+            query=data.query,
+            project_id=data.project_id,
+            estimated_duration=data.estimated_duration_minutes
+        )
+        self._session_progress.move_to_end(session_id)
+        while len(self._session_progress) > MAX_TRACKED_SESSIONS:
+            self._session_progress.popitem(last=False)
+        self._version += 1
         
-        # when session is started, we need to update the trace with the session metadata
-        if self._langfuse_client:
-            self._langfuse_client.update_current_trace(
-                name=f"Research Session: {event.data.get('query', 'Unknown Query')[:50]}...",
-                session_id=session_id,
-                user_id=event.metadata.user_id,
-                input=event.data.get("query"),
-                metadata={
-                    "project_id": event.data.get("project_id"),
-                    "estimated_duration_minutes": event.data.get("estimated_duration_minutes"),
-                    "research_type": "academic_research"
-                },
-                tags=["research", "session_start"]
-            )
+        logger.info("Started tracking research session %s in Langfuse", session_id)
         
-        logger.info(f"Started tracking research session {session_id} in Langfuse")
+        # Without a client only the local bookkeeping above is needed
+        if self._langfuse_client is None:
+            return
+        
+        # when session is started, we need to update the trace with the session metadata
+        title = _trunc(data.query, 50, "Unknown Query")
+        _call_langfuse(
+            self._langfuse_client,
+            "update_current_trace",
+            name=f"Research Session: {title}",
+            session_id=session_id,
+            user_id=meta.user_id,
+            input=data.query,
+            metadata={
+                "project_id": data.project_id,
+                "estimated_duration_minutes": data.estimated_duration_minutes,
+                "research_type": "academic_research"
+            },
+            tags=_TAGS_START
+        )
     
-    @observe(name="task_started")
     async def _handle_task_started(self, event: ResearchTaskStarted) -> None:
-        """Track task start with Langfuse span"""
+        """Track task start with a Langfuse trace event"""
+        data = event.data
         session_id = event.metadata.session_id
         task_id = event.aggregate_id
+        session = self._touch_session(session_id)
         
-        if session_id in self._session_progress:
-            task_info = {
-                "status": "running",
-                "started_at": event.timestamp,
-                "description": event.data.get("task_description"),
-                "estimated_tool_calls": event.data.get("estimated_tool_calls"),
-                "actual_tool_calls": 0,
-                "sources_found": 0
-            }
-            
-            self._session_progress[session_id]["tasks"][task_id] = task_info
-            self._session_progress[session_id]["total_tasks"] += 1
-            
-            # Create Langfuse span for this task
-            if self._langfuse_client:
-                with self._langfuse_client.start_as_current_span(
-                    name=f"Research Task: {event.data.get('task_description', 'Unknown Task')[:30]}...",
-                    input=event.data.get("task_description"),
-                    metadata={
-                        "task_id": task_id,
-                        "session_id": session_id,
-                        "estimated_tool_calls": event.data.get("estimated_tool_calls")
-                    }
-                ) as span:
-                    span.update(
-                        status_message="Task started",
-                        level="INFO"
-                    )
+        if session is not None:
+            session.tasks[task_id] = TaskProgress(
+                status="running",
+                started_at=event.timestamp,
+                description=data.task_description,
+                estimated_tool_calls=data.estimated_tool_calls
+            )
+            session.total_tasks += 1
+            self._version += 1
+        
+        logger.debug("Task %s started in session %s", task_id, session_id)
         
-        logger.debug(f"Task {task_id} started in session {session_id}")
+        if session is None or self._langfuse_client is None:
+            return
+        
+        # Record the task start on the handler's observation, like the
+        # completion and failure updates below
+        _call_langfuse(
+            self._langfuse_client,
+            "update_current_span",
+            name="task_started",
+            level="DEFAULT",
+            status_message="Task started",
+            input=data.task_description,
+            metadata={
+                "task_id": task_id,
+                "session_id": session_id,
+                "estimated_tool_calls": data.estimated_tool_calls
+            }
+        )
     
-    @observe(name="task_completed")
     async def _handle_task_completed(self, event: ResearchTaskCompleted) -> None:
         """Track task completion with Langfuse metrics"""
         session_id = event.metadata.session_id
         task_id = event.aggregate_id
+        session = self._touch_session(session_id)
         
-        if session_id in self._session_progress:
-            if task_id in self._session_progress[session_id]["tasks"]:
-                task_data = self._session_progress[session_id]["tasks"][task_id]
-                task_data.update({
-                    "status": "completed",
-                    "completed_at": event.timestamp,
-                    "duration_seconds": event.data.get("duration_seconds"),
-                    "actual_tool_calls": event.data.get("tool_calls_used"),
-                    "sources_found": event.data.get("sources_count"),
-                    "output_length": len(event.data.get("research_output", ""))
-                })
+        # Read each payload field once for both the local and Langfuse updates
+        data = event.data
+        duration = data.duration_seconds
+        tool_calls = data.tool_calls_used
+        sources = data.sources_count
+        output_length = len(data.research_output)
+        
+        if session is not None:
+            task = session.tasks.get(task_id)
+            if task is not None:
+                task.status = "completed"
+                task.completed_at = event.timestamp
+                task.duration_seconds = duration
+                task.actual_tool_calls = tool_calls
+                task.sources_found = sources
+                task.output_length = output_length
                 
                 # Update session metrics
-                metrics = self._session_progress[session_id]["metrics"]
-                metrics["total_tool_calls"] += event.data.get("tool_calls_used", 0)
-                metrics["sources_analyzed"] += event.data.get("sources_count", 0)
+                metrics = session.metrics
+                metrics.total_tool_calls += tool_calls
+                metrics.sources_analyzed += sources
+                metrics.total_duration_ns += _to_ns(duration)
             
-            self._session_progress[session_id]["completed_tasks"] += 1
-            
-            # Update Langfuse with completion metrics
-            if self._langfuse_client:
-                self._langfuse_client.score_current_trace(
-                    name="task_success",
-                    value=1.0,
-                    comment="Task completed successfully"
-                )
-                
-                # Add detailed metrics as events
-                self._langfuse_client.event_current_trace(
-                    name="task_completed",
-                    input={
-                        "task_id": task_id,
-                        "duration_seconds": event.data.get("duration_seconds"),
-                        "tool_calls_used": event.data.get("tool_calls_used"),
-                        "sources_count": event.data.get("sources_count")
-                    },
-                    metadata={
-                        "output_length": len(event.data.get("research_output", "")),
-                        "efficiency_score": self._calculate_task_efficiency(event)
-                    }
-                )
+            session.completed_tasks += 1
+            self._version += 1
+        
+        logger.debug("Task %s completed in session %s", task_id, session_id)
         
-        logger.debug(f"Task {task_id} completed in session {session_id}")
+        if session is None or self._langfuse_client is None:
+            return
+        
+        # One observation update carries the completion metrics; the former
+        # constant task_success=1.0 score carried no signal and is dropped
+        _call_langfuse(
+            self._langfuse_client,
+            "update_current_span",
+            name="task_completed",
+            level="DEFAULT",
+            input={
+                "task_id": task_id,
+                "duration_seconds": duration,
+                "tool_calls_used": tool_calls,
+                "sources_count": sources
+            },
+            metadata={
+                "output_length": output_length,
+                "efficiency_score": self._calculate_task_efficiency(duration or 0, tool_calls, sources)
+            }
+        )
     
-    @observe(name="task_failed")
     async def _handle_task_failed(self, event: ResearchTaskFailed) -> None:
         """Track task failure with Langfuse error handling"""
+        data = event.data
         session_id = event.metadata.session_id
         task_id = event.aggregate_id
+        session = self._touch_session(session_id)
         
-        if session_id in self._session_progress:
-            if task_id in self._session_progress[session_id]["tasks"]:
-                self._session_progress[session_id]["tasks"][task_id].update({
-                    "status": "failed",
-                    "failed_at": event.timestamp,
-                    "error_message": event.data.get("error_message"),
-                    "error_type": event.data.get("error_type"),
-                    "duration_seconds": event.data.get("duration_seconds"),
-                    "retry_count": event.data.get("retry_count", 0)
-                })
-            
-            self._session_progress[session_id]["failed_tasks"] += 1
+        if session is not None:
+            task = session.tasks.get(task_id)
+            if task is not None:
+                task.status = "failed"
+                task.failed_at = event.timestamp
+                task.error_message = data.error_message
+                task.error_type = data.error_type
+                task.duration_seconds = data.duration_seconds
+                task.retry_count = data.retry_count
             
-            # Record failure in Langfuse
-            if self._langfuse_client:
-                self._langfuse_client.score_current_trace(
-                    name="task_failure",
-                    value=0.0,
-                    comment=f"Task failed: {event.data.get('error_message')}"
-                )
-                
-                self._langfuse_client.event_current_trace(
-                    name="task_failed",
-                    level="ERROR",
-                    input={
-                        "task_id": task_id,
-                        "error_type": event.data.get("error_type"),
-                        "error_message": event.data.get("error_message"),
-                        "retry_count": event.data.get("retry_count", 0)
-                    }
-                )
+            session.failed_tasks += 1
+            self._version += 1
+        
+        logger.warning("Task %s failed in session %s: %s", task_id, session_id, data.error_message)
+        
+        if session is None or self._langfuse_client is None:
+            return
         
-        logger.warning(f"Task {task_id} failed in session {session_id}: {event.data.get('error_message')}")
+        # Record failure in Langfuse as a single event; the failure score rides
+        # along in metadata instead of a separate score call
+        _call_langfuse(
+            self._langfuse_client,
+            "update_current_span",
+            name="task_failed",
+            level="ERROR",
+            status_message=data.error_message,
+            input={
+                "task_id": task_id,
+                "error_type": data.error_type,
+                "error_message": data.error_message,
+                "retry_count": data.retry_count
+            },
+            metadata={
+                "score": 0.0,
+                "score_name": "task_failure"
+            }
+        )
     
-    @observe(name="session_completed")
     async def _handle_session_completed(self, event: ResearchSessionCompleted) -> None:
         """Track session completion with comprehensive Langfuse metrics"""
+        data = event.data
         session_id = event.metadata.session_id
+        session_data = self._touch_session(session_id)
         
-        if session_id in self._session_progress:
-            session_data = self._session_progress[session_id]
-            session_data.update({
-                "status": "completed",
-                "completed_at": event.timestamp,
-                "total_duration_seconds": event.data.get("total_duration_seconds"),
-                "final_report_length": event.data.get("final_report_length"),
-                "success_rate": self._calculate_success_rate(session_data)
-            })
-            
-            # Comprehensive Langfuse trace completion
-            if self._langfuse_client:
-                self._langfuse_client.update_current_trace(
-                    output=f"Research completed: {event.data.get('final_report_length', 0)} characters",
-                    metadata={
-                        "total_tasks": event.data.get("total_tasks"),
-                        "successful_tasks": event.data.get("successful_tasks"),
-                        "failed_tasks": event.data.get("failed_tasks"),
-                        "total_duration_seconds": event.data.get("total_duration_seconds"),
-                        "total_tool_calls": event.data.get("total_tool_calls"),
-                        "success_rate": session_data["success_rate"],
-                        "efficiency_metrics": self._calculate_session_efficiency(event, session_data)
-                    },
-                    tags=["research", "session_complete", "success"]
-                )
-                
-                # Add performance scores
-                self._langfuse_client.score_current_trace(
-                    name="research_quality",
-                    value=self._calculate_quality_score(event, session_data),
-                    comment="Overall research session quality"
-                )
-                
-                self._langfuse_client.score_current_trace(
-                    name="efficiency", 
-                    value=session_data["success_rate"],
-                    comment="Task completion efficiency"
-                )
+        if session_data is not None:
+            session_data.status = "completed"
+            session_data.completed_at = event.timestamp
+            session_data.total_duration_seconds = data.total_duration_seconds
+            session_data.final_report_length = data.final_report_length
+            session_data.total_tool_calls = data.total_tool_calls
+            session_data.success_rate = self._calculate_success_rate(session_data)
+            self._schedule_expiry(session_id)
+            self._version += 1
+        
+        logger.info("Research session %s completed successfully", session_id)
         
-        logger.info(f"Research session {session_id} completed successfully")
+        if session_data is None or self._langfuse_client is None:
+            return
+        
+        # Comprehensive Langfuse trace completion; the efficiency score used to
+        # repeat success_rate, which the metadata below already carries
+        _call_langfuse(
+            self._langfuse_client,
+            "update_current_trace",
+            output=f"Research completed: {data.final_report_length} characters",
+            metadata={
+                "total_tasks": data.total_tasks,
+                "successful_tasks": data.successful_tasks,
+                "failed_tasks": data.failed_tasks,
+                "total_duration_seconds": data.total_duration_seconds,
+                "total_tool_calls": data.total_tool_calls,
+                "success_rate": session_data.success_rate,
+                "efficiency_metrics": self._calculate_session_efficiency(event, session_data)
+            },
+            tags=_TAGS_COMPLETE
+        )
+        
+        # Add performance scores
+        _call_langfuse(
+            self._langfuse_client,
+            "score_current_trace",
+            name="research_quality",
+            value=self._calculate_quality_score(event, session_data),
+            comment="Overall research session quality"
+        )
     
-    @observe(name="session_cancelled")
     async def _handle_session_cancelled(self, event: ResearchSessionCancelled) -> None:
         """Track session cancellation in Langfuse"""
+        data = event.data
         session_id = event.metadata.session_id
+        session = self._touch_session(session_id)
         
-        if session_id in self._session_progress:
-            self._session_progress[session_id].update({
-                "status": "cancelled",
-                "cancelled_at": event.timestamp,
-                "cancellation_reason": event.data.get("reason")
-            })
-            
-            # Record cancellation in Langfuse
-            if self._langfuse_client:
-                self._langfuse_client.update_current_trace(
-                    output="Research session cancelled",
-                    metadata={
-                        "cancellation_reason": event.data.get("reason"),
-                        "partial_completion": True
-                    },
-                    tags=["research", "session_cancelled"]
-                )
-                
-                self._langfuse_client.score_current_trace(
-                    name="completion",
-                    value=0.5,  # Partial credit for cancelled sessions
-                    comment=f"Session cancelled: {event.data.get('reason')}"
-                )
+        if session is not None:
+            session.status = "cancelled"
+            session.cancelled_at = event.timestamp
+            session.cancellation_reason = data.reason
+            self._schedule_expiry(session_id)
+            self._version += 1
+        
+        logger.info("Research session %s was cancelled: %s", session_id, data.reason)
+        
+        if session is None or self._langfuse_client is None:
+            return
+        
+        # Record cancellation in Langfuse
+        _call_langfuse(
+            self._langfuse_client,
+            "update_current_trace",
+            output="Research session cancelled",
+            metadata={
+                "cancellation_reason": data.reason,
+                "partial_completion": True
+            },
+            tags=_TAGS_CANCELLED
+        )
         
-        logger.info(f"Research session {session_id} was cancelled: {event.data.get('reason')}")
+        _call_langfuse(
+            self._langfuse_client,
+            "score_current_trace",
+            name="completion",
+            value=0.5,  # Partial credit for cancelled sessions
+            comment=f"Session cancelled: {data.reason}"
+        )
     
-    def _calculate_task_efficiency(self, event: ResearchTaskCompleted) -> float:
+    def _touch_session(self, session_id: str) -> Optional[SessionProgress]:
+        """Look up a tracked session and mark it as most recently used"""
+        session = self._session_progress.get(session_id)
+        if session is not None:
+            self._session_progress.move_to_end(session_id)
+        return session
+    
+    def _schedule_expiry(self, session_id: str) -> None:
+        """Drop a finished session once SESSION_RETENTION_SECONDS have passed"""
+        asyncio.get_running_loop().call_later(
+            SESSION_RETENTION_SECONDS, self._expire_session, session_id
+        )
+    
+    def _expire_session(self, session_id: str) -> None:
+        """Remove a finished session unless it has been restarted since"""
+        session = self._session_progress.get(session_id)
+        if session is not None and session.status != "in_progress":
+            del self._session_progress[session_id]
+            self._version += 1
+    
+    def _calculate_task_efficiency(self, duration: float, tool_calls: int, sources: int) -> float:
         """Calculate task efficiency score based on performance metrics"""
-        duration = event.data.get("duration_seconds", 0)
-        tool_calls = event.data.get("tool_calls_used", 0)
-        sources = event.data.get("sources_count", 0)
-        
         # Simple efficiency calculation (can be enhanced)
         if duration > 0 and tool_calls > 0:
             return min(1.0, (sources * 10) / (duration * tool_calls))
         return 0.5
     
-    def _calculate_success_rate(self, session_data: Dict[str, Any]) -> float:
+    def _calculate_success_rate(self, session_data: SessionProgress) -> float:
         """Calculate session success rate"""
-        total = session_data.get("total_tasks", 0)
-        completed = session_data.get("completed_tasks", 0)
-        return completed / total if total > 0 else 0.0
+        total = session_data.total_tasks
+        return session_data.completed_tasks / total if total > 0 else 0.0
     
-    def _calculate_session_efficiency(self, event: ResearchSessionCompleted, session_data: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_session_efficiency(self, event: ResearchSessionCompleted, session_data: SessionProgress) -> Dict[str, float]:
         """Calculate comprehensive session efficiency metrics"""
-        total_duration = event.data.get("total_duration_seconds", 0)
-        total_tool_calls = event.data.get("total_tool_calls", 0)
-        report_length = event.data.get("final_report_length", 0)
+        data = event.data
+        total_duration = data.total_duration_seconds
+        total_tool_calls = data.total_tool_calls
+        report_length = data.final_report_length
         
         return {
             "time_efficiency": min(1.0, 3600 / max(total_duration, 1)),  # Higher score for faster completion
             "tool_efficiency": min(1.0, report_length / max(total_tool_calls, 1)),  # Output per tool call
-            "overall_efficiency": session_data["success_rate"]
+            "overall_efficiency": session_data.success_rate
         }
     
-    def _calculate_quality_score(self, event: ResearchSessionCompleted, session_data: Dict[str, Any]) -> float:
+    def _calculate_quality_score(self, event: ResearchSessionCompleted, session_data: SessionProgress) -> float:
         """Calculate research quality score"""
-        report_length = event.data.get("final_report_length", 0)
-        sources_analyzed = session_data.get("metrics", {}).get("sources_analyzed", 0)
-        success_rate = session_data["success_rate"]
+        report_length = event.data.final_report_length
+        sources_analyzed = session_data.metrics.sources_analyzed
+        success_rate = session_data.success_rate
         
         # Quality based on output length, sources, and success rate
         length_score = min(1.0, report_length / 1000)  # Normalize to 1000 chars
@@ -375,13 +708,75 @@ class LangfuseResearchProgressTracker(EventHandler):
         
         return (length_score * 0.4 + source_score * 0.3 + success_rate * 0.3)
     
+    def get_session_scores(self) -> Dict[str, Dict[str, float]]:
+        """
+        Score all completed sessions in one pass.
+        
+        Applies the same formulas as _calculate_session_efficiency and
+        _calculate_quality_score, vectorised with NumPy when it is installed.
+        """
+        completed = [
+            (session_id, data) for session_id, data in self._session_progress.items()
+            if data.status == "completed"
+        ]
+        if not completed:
+            return {}
+        
+        durations = [data.total_duration_seconds or 0 for _, data in completed]
+        tool_calls = [data.total_tool_calls or 0 for _, data in completed]
+        report_lengths = [data.final_report_length or 0 for _, data in completed]
+        sources = [data.metrics.sources_analyzed for _, data in completed]
+        success_rates = [data.success_rate for _, data in completed]
+        
+        if np is not None:
+            durations = np.asarray(durations, dtype=np.float64)
+            tool_calls = np.asarray(tool_calls, dtype=np.float64)
+            report_lengths = np.asarray(report_lengths, dtype=np.float64)
+            sources = np.asarray(sources, dtype=np.float64)
+            success_rates = np.asarray(success_rates, dtype=np.float64)
+            
+            time_eff = np.minimum(1.0, 3600.0 / np.maximum(durations, 1.0))
+            tool_eff = np.minimum(1.0, report_lengths / np.maximum(tool_calls, 1.0))
+            length_score = np.minimum(1.0, report_lengths / 1000.0)
+            source_score = np.minimum(1.0, sources / 10.0)
+            quality = length_score * 0.4 + source_score * 0.3 + success_rates * 0.3
+            rows = zip(time_eff.tolist(), tool_eff.tolist(), quality.tolist())
+        else:
+            rows = (
+                (
+                    min(1.0, 3600 / max(duration, 1)),
+                    min(1.0, length / max(calls, 1)),
+                    min(1.0, length / 1000) * 0.4 + min(1.0, src / 10) * 0.3 + rate * 0.3
+                )
+                for duration, calls, length, src, rate
+                in zip(durations, tool_calls, report_lengths, sources, success_rates)
+            )
+        
+        return {
+            session_id: {
+                "time_efficiency": time_efficiency,
+                "tool_efficiency": tool_efficiency,
+                "quality_score": quality_score
+            }
+            for (session_id, _), (time_efficiency, tool_efficiency, quality_score)
+            in zip(completed, rows)
+        }
+    
     def get_session_progress(self, session_id: str) -> Dict[str, Any]:
         """Get progress information for a session"""
-        return self._session_progress.get(session_id, {})
+        session = self._session_progress.get(session_id)
+        return asdict(session) if session is not None else {}
     
-    def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
-        """Get progress information for all sessions"""
-        return self._session_progress.copy()
+    def get_all_sessions(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of progress information for all sessions"""
+        if self._snapshot_version != self._version:
+            # Read-only so callers cannot corrupt the cached snapshot
+            self._snapshot = MappingProxyType({
+                session_id: asdict(session)
+                for session_id, session in self._session_progress.items()
+            })
+            self._snapshot_version = self._version
+        return self._snapshot
     
     @property
     def event_type(self) -> Type[DomainEvent]:
@@ -392,7 +787,6 @@ class LangfuseResearchProgressTracker(EventHandler):
         return EventPriority.HIGH
 
 
-@observe(name="research_metrics_collection")
 class LangfuseResearchMetricsCollector(EventHandler):
     """
     Enhanced metrics collector with Langfuse integration.
@@ -401,6 +795,13 @@ class LangfuseResearchMetricsCollector(EventHandler):
     Langfuse datasets for performance analysis.
     """
     
+    __slots__ = (
+        "_metrics", "_session_duration_stats", "_task_duration_stats",
+        "_session_dataset_items", "_status_index", "_expiry_heap", "_langfuse_client",
+        "_lf_calls", "_health_task", "_dirty", "_flush_event", "_flush_task",
+        "_dispatch"
+    )
+    
     def __init__(self):
         self._metrics: Dict[str, Any] = {
             "total_sessions": 0,
@@ -412,294 +813,348 @@ class LangfuseResearchMetricsCollector(EventHandler):
             "total_tool_calls": 0,
             "average_session_duration": 0.0,
             "average_task_duration": 0.0,
-            "quality_scores": [],
-            "efficiency_scores": [],
-            "last_updated": None
+            # Sliding windows, bounded so long-running processes stay flat
+            "quality_scores": deque(maxlen=SCORE_WINDOW_SIZE),
+            "efficiency_scores": deque(maxlen=SCORE_WINDOW_SIZE),
+            "last_updated_ts": None  # epoch seconds, formatted on read
         }
+        # Running (count, mean, M2) duration stats for Welford's algorithm
+        self._session_duration_stats = (0, 0.0, 0.0)
+        self._task_duration_stats = (0, 0.0, 0.0)
         # In-memory tracking of dataset items for correlation
         self._session_dataset_items: Dict[str, Dict[str, Any]] = {}
-        try:
-            # Initialize Langfuse client with proper configuration
-            if os.getenv("LANGFUSE_HOST"):
-                logger.info(f"Initializing Langfuse client for: {os.getenv('LANGFUSE_HOST')}")
-            else:
-                logger.info("Initializing Langfuse client for cloud instance")
-            
-            self._langfuse_client = Langfuse()
-            
-            # Test the connection
-            try:
-                test_response = self._langfuse_client.get_project()
-                logger.info(f"✅ Langfuse client connected successfully")
-            except Exception as e:
-                logger.error(f"❌ Failed to connect to Langfuse: {e}")
-                self._langfuse_client = None
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize Langfuse client: {e}")
-            self._langfuse_client = None
+        # Reverse status index over _session_dataset_items
+        self._status_index = StatusIndex()
+        # Min-heap of (expires_at epoch, session_id) driving _cleanup_old_sessions
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._langfuse_client = _get_langfuse()
+        self._lf_calls = _LangfuseCallQueue(self._langfuse_client)
+        # Kept so the one-off connectivity check is not garbage-collected
+        self._health_task: Optional[asyncio.Task] = None
+        # Debounced metrics flushing state
+        self._dirty = False
+        self._flush_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._dispatch: Dict[type, Callable[[Any], Awaitable[None]]] = {
+            ResearchSessionStarted: self._handle_session_started,
+            ResearchSessionCompleted: self._handle_session_completed,
+            ResearchSessionCancelled: self._handle_session_cancelled,
+            ResearchTaskStarted: self._handle_task_started,
+            ResearchTaskCompleted: self._handle_task_completed,
+            ResearchTaskFailed: self._handle_task_failed
+        }
     
     @observe(name="collect_metrics")
     async def handle(self, event: DomainEvent) -> None:
         """Collect metrics with Langfuse dataset integration"""
-        match event:
-            case ResearchSessionStarted():
-                self._metrics["total_sessions"] += 1
-                await self._create_session_dataset_item(event)
-            
-            case ResearchSessionCompleted():
-                self._metrics["completed_sessions"] += 1
-                self._update_session_duration_metric(event.data.get("total_duration_seconds", 0))
-                await self._update_session_dataset_item(event)
-            
-            case ResearchSessionCancelled():
-                self._metrics["cancelled_sessions"] += 1
-            
-            case ResearchTaskStarted():
-                self._metrics["total_tasks"] += 1
-            
-            case ResearchTaskCompleted():
-                self._metrics["completed_tasks"] += 1
-                self._metrics["total_tool_calls"] += event.data.get("tool_calls_used", 0)
-                self._update_task_duration_metric(event.data.get("duration_seconds", 0))
-            
-            case ResearchTaskFailed():
-                self._metrics["failed_tasks"] += 1
-                self._metrics["total_tool_calls"] += event.data.get("tool_calls_made", 0)
+        if self._health_task is None and self._langfuse_client:
+            self._health_task = asyncio.create_task(self._verify_langfuse())
         
-        self._metrics["last_updated"] = datetime.now(timezone.utc).isoformat()
+        handler = self._dispatch.get(type(event))
+        if handler is not None:
+            await handler(event)
         
-        # Periodically send metrics to Langfuse
-        if self._metrics["total_sessions"] % 5 == 0:
-            await self._send_metrics_to_langfuse()
+        self._metrics["last_updated_ts"] = time.time()
+        
+        # Coalesce metric sends into one debounced background flush
+        self._dirty = True
+        self._flush_event.set()
+        if self._flush_task is None and self._langfuse_client:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _verify_langfuse(self) -> None:
+        """Disable Langfuse emission if the backend turns out to be unreachable"""
+        if not await _check_langfuse_connection(self._langfuse_client):
+            self._langfuse_client = None
+            self._lf_calls.disable()
+    
+    async def _handle_session_started(self, event: ResearchSessionStarted) -> None:
+        self._metrics["total_sessions"] += 1
+        await self._create_session_dataset_item(event)
+    
+    async def _handle_session_completed(self, event: ResearchSessionCompleted) -> None:
+        self._metrics["completed_sessions"] += 1
+        self._update_session_duration_metric(event.data.total_duration_seconds)
+        await self._update_session_dataset_item(event)
+    
+    async def _handle_session_cancelled(self, event: ResearchSessionCancelled) -> None:
+        self._metrics["cancelled_sessions"] += 1
+        await self._mark_session_cancelled(event)
+    
+    async def _handle_task_started(self, event: ResearchTaskStarted) -> None:
+        self._metrics["total_tasks"] += 1
+    
+    async def _handle_task_completed(self, event: ResearchTaskCompleted) -> None:
+        data = event.data
+        self._metrics["completed_tasks"] += 1
+        self._metrics["total_tool_calls"] += data.tool_calls_used
+        self._update_task_duration_metric(data.duration_seconds)
+    
+    async def _handle_task_failed(self, event: ResearchTaskFailed) -> None:
+        self._metrics["failed_tasks"] += 1
+        self._metrics["total_tool_calls"] += event.data.tool_calls_made
     
     async def _create_session_dataset_item(self, event: ResearchSessionStarted):
         """Create a dataset item in Langfuse for this research session"""
-        if self._langfuse_client:
-            try:
-                # Create the dataset item in Langfuse backend
-                dataset_item = self._langfuse_client.create_dataset_item(
-                    dataset_name="research_sessions",
-                    input={
-                        "query": event.data.get("query"),
-                        "project_id": event.data.get("project_id"),
-                        "estimated_duration": event.data.get("estimated_duration_minutes")
-                    },
-                    expected_output=None,  # Will be updated on completion
-                    metadata={
-                        "session_id": event.metadata.session_id,
-                        "user_id": event.metadata.user_id,
-                        "started_at": event.timestamp.isoformat()
-                    }
-                )
-                
-                # Store reference in memory for later updates
-                self._session_dataset_items[event.metadata.session_id] = {
-                    "dataset_item_id": dataset_item.id,  # Store the ID for updates
-                    "input": event.data.get("query"),
-                    "started_at": event.timestamp.isoformat(),
-                    "status": "in_progress",
-                    "project_id": event.data.get("project_id")
-                }
-                
-                logger.debug(f"Created dataset item for session {event.metadata.session_id}")
-                
-            except Exception as e:
-                logger.error(f"Failed to create dataset item for session {event.metadata.session_id}: {e}")
-                # Store basic info even if Langfuse fails
-                self._session_dataset_items[event.metadata.session_id] = {
-                    "dataset_item_id": None,
-                    "input": event.data.get("query"),
-                    "started_at": event.timestamp.isoformat(),
-                    "status": "in_progress",
-                    "project_id": event.data.get("project_id"),
-                    "error": str(e)
-                }
+        data = event.data
+        meta = event.metadata
+        if self._langfuse_client is None:
+            return
+        
+        # Timestamps are kept as epoch seconds and formatted on read
+        started_at = _epoch_seconds(event.timestamp)
+        
+        # Sampled-out sessions are tracked locally without an item ID, so
+        # the completion and cancellation updates skip them
+        if random.random() >= LANGFUSE_DATASET_SAMPLE_RATE:
+            self._session_dataset_items[meta.session_id] = {
+                "dataset_item_id": None,
+                "input": data.query,
+                "started_at": started_at,
+                "status": "in_progress",
+                "project_id": data.project_id,
+                "sampled_out": True
+            }
+            self._status_index.set(meta.session_id, "in_progress")
+            return
+        
+        try:
+            # Create the dataset item in Langfuse backend; the ID is needed
+            # for later updates, so await it off the event loop
+            dataset_item = await asyncio.to_thread(
+                self._langfuse_client.create_dataset_item,
+                dataset_name="research_sessions",
+                input=_to_json_ready({
+                    "query": data.query,
+                    "project_id": data.project_id,
+                    "estimated_duration": data.estimated_duration_minutes
+                }),
+                expected_output=None,  # Will be updated on completion
+                metadata=_to_json_ready({
+                    "session_id": meta.session_id,
+                    "user_id": meta.user_id,
+                    "started_at": event.timestamp_iso
+                })
+            )
+            
+            # Store reference in memory for later updates
+            self._session_dataset_items[meta.session_id] = {
+                "dataset_item_id": dataset_item.id,  # Store the ID for updates
+                "input": data.query,
+                "started_at": started_at,
+                "status": "in_progress",
+                "project_id": data.project_id
+            }
+            
+            logger.debug("Created dataset item for session %s", meta.session_id)
+            
+        except Exception as e:
+            logger.error("Failed to create dataset item for session %s: %s", meta.session_id, e)
+            # Store basic info even if Langfuse fails
+            expires_at = time.time() + DATASET_ERROR_RETENTION_SECONDS
+            self._session_dataset_items[meta.session_id] = {
+                "dataset_item_id": None,
+                "input": data.query,
+                "started_at": started_at,
+                "status": "in_progress",
+                "project_id": data.project_id,
+                "error": str(e),
+                "expires_at": expires_at
+            }
+            heapq.heappush(self._expiry_heap, (expires_at, meta.session_id))
+        
+        self._status_index.set(meta.session_id, "in_progress")
     
     async def _update_session_dataset_item(self, event: ResearchSessionCompleted):
         """Update the dataset item with completion data"""
+        data = event.data
         session_id = event.metadata.session_id
         
-        if session_id in self._session_dataset_items:
-            session_data = self._session_dataset_items[session_id]
+        session_data = self._session_dataset_items.get(session_id)
+        if session_data is not None:
+            ts_iso = event.timestamp_iso
             
             # Update in-memory tracking
             session_data["status"] = "completed"
-            session_data["completed_at"] = event.timestamp.isoformat()
+            self._status_index.set(session_id, "completed")
+            session_data["completed_at"] = _epoch_seconds(event.timestamp)
+            session_data["expires_at"] = time.time() + SESSION_RETENTION_SECONDS
+            heapq.heappush(self._expiry_heap, (session_data["expires_at"], session_id))
             session_data["final_metrics"] = {
-                "total_tasks": event.data.get("total_tasks", 0),
-                "successful_tasks": event.data.get("successful_tasks", 0),
-                "failed_tasks": event.data.get("failed_tasks", 0),
-                "total_duration_seconds": event.data.get("total_duration_seconds", 0),
-                "total_tool_calls": event.data.get("total_tool_calls", 0),
-                "success_rate": event.data.get("success_rate", 0.0),
-                "final_report_length": event.data.get("final_report_length", 0)
+                "total_tasks": data.total_tasks,
+                "successful_tasks": data.successful_tasks,
+                "failed_tasks": data.failed_tasks,
+                "total_duration_seconds": data.total_duration_seconds,
+                "total_tool_calls": data.total_tool_calls,
+                "success_rate": data.success_rate,
+                "final_report_length": data.final_report_length
             }
             
             # Update the dataset item in Langfuse backend if we have a valid ID
             if session_data["dataset_item_id"] and self._langfuse_client:
-                try:
-                    self._langfuse_client.update_dataset_item(
-                        id=session_data["dataset_item_id"],
-                        expected_output={
-                            "final_report": event.data.get("final_report", ""),
-                            "total_tasks": event.data.get("total_tasks", 0),
-                            "successful_tasks": event.data.get("successful_tasks", 0),
-                            "failed_tasks": event.data.get("failed_tasks", 0),
-                            "total_duration_seconds": event.data.get("total_duration_seconds", 0),
-                            "total_tool_calls": event.data.get("total_tool_calls", 0),
-                            "success_rate": event.data.get("success_rate", 0.0)
-                        },
-                        metadata={
-                            "completed_at": event.timestamp.isoformat(),
-                            "final_report_length": event.data.get("final_report_length", 0),
-                            "session_status": "completed"
-                        }
-                    )
-                    
-                    logger.debug(f"Updated dataset item for completed session {session_id}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to update dataset item for session {session_id}: {e}")
-                    session_data["update_error"] = str(e)
-            else:
-                logger.warning(f"No valid dataset item ID for session {session_id}, skipping update")
+                self._lf_calls.submit(
+                    "update_dataset_item",
+                    id=session_data["dataset_item_id"],
+                    expected_output={
+                        "final_report": data.get("final_report", ""),
+                        "total_tasks": data.total_tasks,
+                        "successful_tasks": data.successful_tasks,
+                        "failed_tasks": data.failed_tasks,
+                        "total_duration_seconds": data.total_duration_seconds,
+                        "total_tool_calls": data.total_tool_calls,
+                        "success_rate": data.success_rate
+                    },
+                    metadata={
+                        "completed_at": ts_iso,
+                        "final_report_length": data.final_report_length,
+                        "session_status": "completed"
+                    }
+                )
+                
+                logger.debug("Queued dataset item update for completed session %s", session_id)
+            elif not session_data.get("sampled_out"):
+                logger.warning("No valid dataset item ID for session %s, skipping update", session_id)
             
             # Clean up old completed sessions to prevent memory bloat
             await self._cleanup_old_sessions()
         else:
-            logger.warning(f"Session {session_id} not found in dataset tracking, skipping update")
+            logger.warning("Session %s not found in dataset tracking, skipping update", session_id)
     
     async def _mark_session_cancelled(self, event: ResearchSessionCancelled):
         """Mark a session as cancelled in the dataset tracking"""
+        data = event.data
         session_id = event.metadata.session_id
         
-        if session_id in self._session_dataset_items:
-            session_data = self._session_dataset_items[session_id]
+        session_data = self._session_dataset_items.get(session_id)
+        if session_data is not None:
+            ts_iso = event.timestamp_iso
             
             # Update in-memory tracking
             session_data["status"] = "cancelled"
-            session_data["cancelled_at"] = event.timestamp.isoformat()
-            session_data["cancellation_reason"] = event.data.get("reason", "Unknown")
+            self._status_index.set(session_id, "cancelled")
+            session_data["cancelled_at"] = _epoch_seconds(event.timestamp)
+            session_data["cancellation_reason"] = data.reason
             
             # Update the dataset item in Langfuse backend if we have a valid ID
             if session_data["dataset_item_id"] and self._langfuse_client:
-                try:
-                    self._langfuse_client.update_dataset_item(
-                        id=session_data["dataset_item_id"],
-                        expected_output=None,  # No output for cancelled sessions
-                        metadata={
-                            "cancelled_at": event.timestamp.isoformat(),
-                            "cancellation_reason": event.data.get("reason", "Unknown"),
-                            "session_status": "cancelled"
-                        }
-                    )
-                    
-                    logger.debug(f"Updated dataset item for cancelled session {session_id}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to update dataset item for cancelled session {session_id}: {e}")
-                    session_data["update_error"] = str(e)
+                self._lf_calls.submit(
+                    "update_dataset_item",
+                    id=session_data["dataset_item_id"],
+                    expected_output=None,  # No output for cancelled sessions
+                    metadata={
+                        "cancelled_at": ts_iso,
+                        "cancellation_reason": data.reason,
+                        "session_status": "cancelled"
+                    }
+                )
+                
+                logger.debug("Queued dataset item update for cancelled session %s", session_id)
         else:
-            logger.warning(f"Session {session_id} not found in dataset tracking, cannot mark as cancelled")
+            logger.warning("Session %s not found in dataset tracking, cannot mark as cancelled", session_id)
     
     async def _cleanup_old_sessions(self):
         """Clean up old completed sessions to prevent memory bloat"""
         try:
-            current_time = datetime.now(timezone.utc)
-            sessions_to_remove = []
+            current_time = time.time()
             
-            for session_id, session_data in self._session_dataset_items.items():
-                if session_data["status"] == "completed":
-                    # Remove sessions completed more than 24 hours ago
-                    if "completed_at" in session_data:
-                        completed_time = datetime.fromisoformat(session_data["completed_at"])
-                        if (current_time - completed_time).total_seconds() > 86400:  # 24 hours
-                            sessions_to_remove.append(session_id)
-                
-                # Also remove sessions with errors that are older than 1 hour
-                elif "error" in session_data and "started_at" in session_data:
-                    started_time = datetime.fromisoformat(session_data["started_at"])
-                    if (current_time - started_time).total_seconds() > 3600:  # 1 hour
-                        sessions_to_remove.append(session_id)
-            
-            # Remove old sessions
-            for session_id in sessions_to_remove:
-                del self._session_dataset_items[session_id]
-                logger.debug(f"Cleaned up old session {session_id}")
+            # Pop expired entries: completed sessions after 24 hours, sessions
+            # with errors after 1 hour. Entries whose item was replaced or
+            # already removed no longer match expires_at and are skipped.
+            while self._expiry_heap and self._expiry_heap[0][0] <= current_time:
+                expires_at, session_id = heapq.heappop(self._expiry_heap)
+                session_data = self._session_dataset_items.get(session_id)
+                if session_data is not None and session_data.get("expires_at") == expires_at:
+                    del self._session_dataset_items[session_id]
+                    self._status_index.discard(session_id)
+                    logger.debug("Cleaned up old session %s", session_id)
             
-            # If we still have too many sessions, remove oldest ones
+            # If we still have too many sessions, remove oldest ones; items are
+            # inserted at session start, so dict order is started_at order
             if len(self._session_dataset_items) > 1000:  # Keep max 1000 sessions in memory
-                oldest_sessions = sorted(
-                    self._session_dataset_items.items(),
-                    key=lambda x: x[1].get("started_at", "0")
-                )[:500]  # Remove oldest 500
+                oldest_sessions = list(islice(self._session_dataset_items, 500))  # Remove oldest 500
                 
-                for session_id, _ in oldest_sessions:
+                for session_id in oldest_sessions:
                     del self._session_dataset_items[session_id]
+                    self._status_index.discard(session_id)
                 
-                logger.info(f"Cleaned up {len(oldest_sessions)} old sessions to maintain memory limit")
+                logger.info("Cleaned up %s old sessions to maintain memory limit", len(oldest_sessions))
                 
         except Exception as e:
-            logger.error(f"Error during session cleanup: {e}")
+            logger.error("Error during session cleanup: %s", e)
     
     def get_dataset_statistics(self) -> Dict[str, Any]:
         """Get statistics about the tracked dataset items"""
         if not self._session_dataset_items:
             return {"total_sessions": 0, "status_breakdown": {}}
         
-        status_counts = {}
-        for session_data in self._session_dataset_items.values():
-            status = session_data.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = self._status_index.counts()
         
+        # Items are inserted at session start, so dict order is started_at order
+        items = self._session_dataset_items.values()
         return {
             "total_sessions": len(self._session_dataset_items),
             "status_breakdown": status_counts,
-            "memory_usage_mb": len(str(self._session_dataset_items)) / (1024 * 1024),  # Rough estimate
-            "oldest_session": min(
-                (data.get("started_at") for data in self._session_dataset_items.values() if data.get("started_at")),
-                default=None
-            ),
-            "newest_session": max(
-                (data.get("started_at") for data in self._session_dataset_items.values() if data.get("started_at")),
-                default=None
-            )
+            "memory_usage_mb": len(self._session_dataset_items) * DATASET_ITEM_APPROX_BYTES / (1024 * 1024),  # Rough estimate
+            "oldest_session": _format_epoch(next(iter(items)).get("started_at")),
+            "newest_session": _format_epoch(next(reversed(items)).get("started_at"))
         }
     
-    async def _send_metrics_to_langfuse(self):
+    async def _flush_loop(self):
+        """Send metrics to Langfuse at most once per debounce window"""
+        while True:
+            await self._flush_event.wait()
+            await asyncio.sleep(METRICS_FLUSH_DEBOUNCE_SECONDS)
+            self._flush_event.clear()
+            if not self._dirty:
+                continue
+            self._dirty = False
+            try:
+                # The SDK call is blocking, keep it off the event loop
+                await asyncio.to_thread(self._send_metrics_to_langfuse)
+            except Exception as e:
+                logger.error("Failed to send metrics to Langfuse: %s", e)
+    
+    def _send_metrics_to_langfuse(self):
         """Send aggregated metrics to Langfuse as events"""
-        if self._langfuse_client:
-            self._langfuse_client.event(
-                name="system_metrics_update",
-                input=self._metrics,
-                metadata={
-                    "metric_type": "research_performance",
-                    "timestamp": self._metrics["last_updated"]
-                }
-            )
+        if self._langfuse_client is None:
+            return
+        
+        metrics = self.get_metrics()
+        self._langfuse_client.event(
+            name="system_metrics_update",
+            input=_to_json_ready(metrics),
+            metadata={
+                "metric_type": "research_performance",
+                "timestamp": metrics["last_updated"]
+            }
+        )
     
     def _update_session_duration_metric(self, duration: float) -> None:
-        """Update average session duration"""
-        completed = self._metrics["completed_sessions"]
-        if completed > 1:
-            current_avg = self._metrics["average_session_duration"]
-            self._metrics["average_session_duration"] = ((current_avg * (completed - 1)) + duration) / completed
-        else:
-            self._metrics["average_session_duration"] = duration
+        """Fold a session duration into the running duration stats"""
+        self._session_duration_stats = _welford_update(self._session_duration_stats, duration)
     
     def _update_task_duration_metric(self, duration: float) -> None:
-        """Update average task duration"""
-        completed = self._metrics["completed_tasks"]
-        if completed > 1:
-            current_avg = self._metrics["average_task_duration"]
-            self._metrics["average_task_duration"] = ((current_avg * (completed - 1)) + duration) / completed
-        else:
-            self._metrics["average_task_duration"] = duration
+        """Fold a task duration into the running duration stats"""
+        self._task_duration_stats = _welford_update(self._task_duration_stats, duration)
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics"""
-        return self._metrics.copy()
+        metrics = self._metrics.copy()
+        for key in ("quality_scores", "efficiency_scores"):
+            scores = metrics[key]
+            metrics[key] = list(scores)
+            metrics[f"average_{key[:-1]}"] = statistics.fmean(scores) if scores else 0.0
+        # Averages are read off the running stats here rather than stored per event
+        metrics["average_session_duration"] = self._session_duration_stats[1]
+        metrics["average_task_duration"] = self._task_duration_stats[1]
+        metrics["session_duration_variance"] = _welford_variance(self._session_duration_stats)
+        metrics["task_duration_variance"] = _welford_variance(self._task_duration_stats)
+        last_updated_ts = metrics.pop("last_updated_ts")
+        metrics["last_updated"] = (
+            datetime.fromtimestamp(last_updated_ts, tz=timezone.utc).isoformat()
+            if last_updated_ts is not None else None
+        )
+        return metrics
     
     @property
     def event_type(self) -> Type[DomainEvent]:
@@ -709,11 +1164,14 @@ class LangfuseResearchMetricsCollector(EventHandler):
     def priority(self) -> EventPriority:
         return EventPriority.NORMAL
 
-    def get_session_details(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information about a specific session"""
-        if session_id in self._session_dataset_items:
-            return self._session_dataset_items[session_id].copy()
-        return None
+    def get_session_details(self, session_id: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a read-only view of detailed information about a specific session.
+        
+        started_at, completed_at and cancelled_at are epoch seconds.
+        """
+        session_data = self._session_dataset_items.get(session_id)
+        return MappingProxyType(session_data) if session_data is not None else None
     
     def get_all_session_ids(self) -> list:
         """Get list of all tracked session IDs"""
@@ -721,7 +1179,4 @@ class LangfuseResearchMetricsCollector(EventHandler):
     
     def get_sessions_by_status(self, status: str) -> list:
         """Get all sessions with a specific status"""
-        return [
-            session_id for session_id, data in self._session_dataset_items.items()
-            if data.get("status") == status
-        ]
+        return self._status_index.ids(status)
@@ -6,7 +6,13 @@ These handlers implement business logic side effects.
 """
 
 import logging
-from typing import Type, Dict, Any
+import random
+import time
+from array import array
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Type, Dict, Any, Tuple, Mapping, List, Optional, Iterator, Callable, Awaitable
 from datetime import datetime, timezone
 
 from ..base import DomainEvent, EventHandler, EventPriority
@@ -21,6 +27,284 @@ from ..research_events import (
 
 logger = logging.getLogger(__name__)
 
+# Audit entries kept in memory by ResearchAuditLogger
+AUDIT_LOG_MAX_ENTRIES = 10_000
+
+
+def _welford_update(stats: Tuple[int, float, float], x: float) -> Tuple[int, float, float]:
+    """Fold sample x into running (count, mean, M2) stats (Welford's algorithm)"""
+    count, mean, m2 = stats
+    count += 1
+    delta = x - mean
+    mean += delta / count
+    m2 += delta * (x - mean)
+    return count, mean, m2
+
+
+def _welford_variance(stats: Tuple[int, float, float]) -> float:
+    """Sample variance from running (count, mean, M2) stats"""
+    count, _, m2 = stats
+    return m2 / (count - 1) if count > 1 else 0.0
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    """Epoch seconds for an event timestamp; naive timestamps are UTC"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _format_epoch(ts: Optional[float]) -> Optional[str]:
+    """ISO-8601 UTC string for stored epoch seconds"""
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class StatusIndex:
+    """
+    session_id -> status mapping with a reverse index per status.
+    
+    Keeps per-status counts and member lists O(1) to read instead of
+    scanning every session. Members are kept in insertion order.
+    """
+    
+    def __init__(self):
+        self._status_of: Dict[str, str] = {}
+        self._members: Dict[str, Dict[str, None]] = {}
+    
+    def set(self, session_id: str, status: str) -> None:
+        previous = self._status_of.get(session_id)
+        if previous == status:
+            return
+        if previous is not None:
+            del self._members[previous][session_id]
+        self._status_of[session_id] = status
+        self._members.setdefault(status, {})[session_id] = None
+    
+    def discard(self, session_id: str) -> None:
+        previous = self._status_of.pop(session_id, None)
+        if previous is not None:
+            del self._members[previous][session_id]
+    
+    def counts(self) -> Dict[str, int]:
+        return {status: len(ids) for status, ids in self._members.items() if ids}
+    
+    def ids(self, status: str) -> List[str]:
+        return list(self._members.get(status, ()))
+
+
+class SessionColumns:
+    """
+    Per-session scalar fields stored column-wise.
+    
+    Each session owns one row index into parallel columns, so bulk scans
+    (status breakdowns, oldest/newest) walk a flat list instead of one dict
+    per session. Removal swaps the last row into the freed slot.
+    """
+    
+    def __init__(self):
+        self._id_to_idx: Dict[str, int] = {}
+        self._idx_to_id: List[str] = []
+        self._status_index = StatusIndex()
+        self.statuses: List[str] = []
+        self.started_at = array("d")  # epoch seconds
+        self.total_tasks = array("i")
+        self.completed_tasks = array("i")
+        self.failed_tasks = array("i")
+    
+    def __len__(self) -> int:
+        return len(self._idx_to_id)
+    
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._id_to_idx
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._idx_to_id)
+    
+    def index(self, session_id: str) -> Optional[int]:
+        """Row index of a session, or None if it is not tracked"""
+        return self._id_to_idx.get(session_id)
+    
+    def session_id(self, idx: int) -> str:
+        return self._idx_to_id[idx]
+    
+    def add(self, session_id: str, status: str, started_at: float) -> int:
+        """Add a session, or reset its row if it is already tracked"""
+        idx = self._id_to_idx.get(session_id)
+        if idx is None:
+            idx = len(self._idx_to_id)
+            self._id_to_idx[session_id] = idx
+            self._idx_to_id.append(session_id)
+            self._status_index.set(session_id, status)
+            self.statuses.append(status)
+            self.started_at.append(started_at)
+            self.total_tasks.append(0)
+            self.completed_tasks.append(0)
+            self.failed_tasks.append(0)
+        else:
+            self.set_status(idx, status)
+            self.started_at[idx] = started_at
+            self.total_tasks[idx] = self.completed_tasks[idx] = self.failed_tasks[idx] = 0
+        return idx
+    
+    def set_status(self, idx: int, status: str) -> None:
+        self.statuses[idx] = status
+        self._status_index.set(self._idx_to_id[idx], status)
+    
+    def remove(self, session_id: str) -> bool:
+        """Drop a session's row; False if it was not tracked"""
+        idx = self._id_to_idx.pop(session_id, None)
+        if idx is None:
+            return False
+        self._status_index.discard(session_id)
+        last = len(self._idx_to_id) - 1
+        if idx != last:
+            moved_id = self._idx_to_id[last]
+            self._idx_to_id[idx] = moved_id
+            self._id_to_idx[moved_id] = idx
+            for column in self._columns():
+                column[idx] = column[last]
+        self._idx_to_id.pop()
+        for column in self._columns():
+            column.pop()
+        return True
+    
+    def status_counts(self) -> Dict[str, int]:
+        return self._status_index.counts()
+    
+    def ids_with_status(self, status: str) -> List[str]:
+        return self._status_index.ids(status)
+    
+    def _columns(self) -> tuple:
+        return (self.statuses, self.started_at, self.total_tasks, self.completed_tasks, self.failed_tasks)
+
+
+class TaskColumns:
+    """
+    One session's tasks stored column-wise.
+    
+    Status and the numeric fields used by rollups live in flat columns
+    indexed by task row; timestamps, descriptions and failure details stay
+    in a per-row dict that is only read when task entries are composed.
+    """
+    
+    def __init__(self):
+        self._id_to_idx: Dict[str, int] = {}
+        self.task_ids: List[str] = []
+        self.statuses: List[str] = []
+        self.duration_seconds = array("d")
+        self.tool_calls = array("i")
+        self.sources_count = array("i")
+        self._details: List[Dict[str, Any]] = []
+    
+    def __len__(self) -> int:
+        return len(self.task_ids)
+    
+    def index(self, task_id: str) -> Optional[int]:
+        """Row index of a task, or None if it is not tracked"""
+        return self._id_to_idx.get(task_id)
+    
+    def add(self, task_id: str, details: Dict[str, Any]) -> int:
+        """Add a running task, or reset its row if it is already tracked"""
+        idx = self._id_to_idx.get(task_id)
+        if idx is None:
+            idx = len(self.task_ids)
+            self._id_to_idx[task_id] = idx
+            self.task_ids.append(task_id)
+            self.statuses.append("running")
+            self.duration_seconds.append(0.0)
+            self.tool_calls.append(0)
+            self.sources_count.append(0)
+            self._details.append(details)
+        else:
+            self.statuses[idx] = "running"
+            self.duration_seconds[idx] = 0.0
+            self.tool_calls[idx] = self.sources_count[idx] = 0
+            self._details[idx] = details
+        return idx
+    
+    def finish(
+        self,
+        idx: int,
+        status: str,
+        duration_seconds: float,
+        tool_calls: int,
+        sources_count: int = 0,
+        **details: Any
+    ) -> None:
+        """Record the outcome of a task row"""
+        self.statuses[idx] = status
+        self.duration_seconds[idx] = duration_seconds or 0.0
+        self.tool_calls[idx] = tool_calls or 0
+        self.sources_count[idx] = sources_count or 0
+        self._details[idx].update(details)
+    
+    def rollup(self) -> Tuple[Dict[str, int], float, int]:
+        """(status counts, mean duration of finished tasks, total tool calls)"""
+        status_counts: Dict[str, int] = {}
+        finished_duration = 0.0
+        finished = 0
+        for status, duration in zip(self.statuses, self.duration_seconds):
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if status != "running":
+                finished_duration += duration
+                finished += 1
+        mean_duration = finished_duration / finished if finished else 0.0
+        return status_counts, mean_duration, sum(self.tool_calls)
+    
+    def entry(self, idx: int) -> Dict[str, Any]:
+        """Compose the task dict exposed in session progress"""
+        status = self.statuses[idx]
+        task = {"status": status, **self._details[idx]}
+        if status == "completed":
+            task["duration_seconds"] = self.duration_seconds[idx]
+            task["tool_calls_used"] = self.tool_calls[idx]
+            task["sources_count"] = self.sources_count[idx]
+        elif status == "failed":
+            task["duration_seconds"] = self.duration_seconds[idx]
+        return task
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {task_id: self.entry(idx) for idx, task_id in enumerate(self.task_ids)}
+
+
+class _SessionProgressView(Mapping):
+    """Read-only session_id -> progress dict view, built per lookup"""
+    
+    def __init__(self, tracker: "ResearchProgressTracker"):
+        self._tracker = tracker
+    
+    def __getitem__(self, session_id: str) -> Dict[str, Any]:
+        return self._tracker._compose_progress(session_id)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tracker._columns)
+    
+    def __len__(self) -> int:
+        return len(self._tracker._columns)
+
+
+class _MetricsView(Mapping):
+    """Read-only live metrics view that formats last_updated on read"""
+    
+    def __init__(self, metrics: Dict[str, Any]):
+        self._metrics = metrics
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "last_updated":
+            return _format_epoch(self._metrics[key])
+        return self._metrics[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._metrics)
+    
+    def __len__(self) -> int:
+        return len(self._metrics)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
 
 class ResearchProgressTracker(EventHandler):
     """
@@ -31,132 +315,189 @@ class ResearchProgressTracker(EventHandler):
     - Aggregate metrics across all sessions via get_all_sessions() 
     """
     
+    __slots__ = ("_columns", "_session_details", "_dispatch")
+    
     def __init__(self):
-        self._session_progress: Dict[str, Dict[str, Any]] = {}
+        # Scalar per-session fields, scanned in bulk
+        self._columns = SessionColumns()
+        # Descriptive fields and task entries, only read per session
+        self._session_details: Dict[str, Dict[str, Any]] = {}
+        self._dispatch: Dict[type, Callable[[Any], Awaitable[None]]] = {
+            ResearchSessionStarted: self._handle_session_started,
+            ResearchTaskStarted: self._handle_task_started,
+            ResearchTaskCompleted: self._handle_task_completed,
+            ResearchTaskFailed: self._handle_task_failed,
+            ResearchSessionCompleted: self._handle_session_completed,
+            ResearchSessionCancelled: self._handle_session_cancelled
+        }
     
     async def handle(self, event: DomainEvent) -> None:
         """Handle research progress events"""
-        session_id = event.metadata.session_id
-        
-        # Handle events even without session_id for some events
-        match event:
-            case ResearchSessionStarted():
-                await self._handle_session_started(event)
-            case ResearchTaskStarted():
-                await self._handle_task_started(event)
-            case ResearchTaskCompleted():
-                await self._handle_task_completed(event)
-            case ResearchTaskFailed():
-                await self._handle_task_failed(event)
-            case ResearchSessionCompleted():
-                await self._handle_session_completed(event)
-            case ResearchSessionCancelled():
-                await self._handle_session_cancelled(event)
+        handler = self._dispatch.get(type(event))
+        if handler is not None:
+            await handler(event)
     
     async def _handle_session_started(self, event: ResearchSessionStarted) -> None:
         """Initialize progress tracking for a new session"""
+        data = event.data
         session_id = event.metadata.session_id
-        self._session_progress[session_id] = {
-            "status": "in_progress",
+        self._columns.add(session_id, "in_progress", _epoch_seconds(event.timestamp))
+        self._session_details[session_id] = {
             "started_at": event.timestamp,
-            "query": event.data.get("query"),
-            "project_id": event.data.get("project_id"),
-            "tasks": {},
-            "total_tasks": 0,
-            "completed_tasks": 0,
-            "failed_tasks": 0
+            "query": data.query,
+            "project_id": data.project_id,
+            "tasks": TaskColumns()
         }
         
-        logger.info(f"Started tracking progress for session {session_id}")
+        logger.info("Started tracking progress for session %s", session_id)
     
     async def _handle_task_started(self, event: ResearchTaskStarted) -> None:
         """Track task start"""
+        data = event.data
         session_id = event.metadata.session_id
         task_id = event.aggregate_id
         
-        if session_id in self._session_progress:
-            self._session_progress[session_id]["tasks"][task_id] = {
-                "status": "running",
+        idx = self._columns.index(session_id)
+        if idx is not None:
+            self._session_details[session_id]["tasks"].add(task_id, {
                 "started_at": event.timestamp,
-                "description": event.data.get("task_description"),
-                "estimated_tool_calls": event.data.get("estimated_tool_calls")
-            }
-            self._session_progress[session_id]["total_tasks"] += 1
+                "description": data.task_description,
+                "estimated_tool_calls": data.estimated_tool_calls
+            })
+            self._columns.total_tasks[idx] += 1
         
-        logger.debug(f"Task {task_id} started in session {session_id}")
+        logger.debug("Task %s started in session %s", task_id, session_id)
     
     async def _handle_task_completed(self, event: ResearchTaskCompleted) -> None:
         """Track task completion"""
+        data = event.data
         session_id = event.metadata.session_id
         task_id = event.aggregate_id
         
-        if session_id in self._session_progress:
-            if task_id in self._session_progress[session_id]["tasks"]:
-                self._session_progress[session_id]["tasks"][task_id].update({
-                    "status": "completed",
-                    "completed_at": event.timestamp,
-                    "duration_seconds": event.data.get("duration_seconds"),
-                    "tool_calls_used": event.data.get("tool_calls_used"),
-                    "sources_count": event.data.get("sources_count")
-                })
+        idx = self._columns.index(session_id)
+        if idx is not None:
+            tasks = self._session_details[session_id]["tasks"]
+            task_idx = tasks.index(task_id)
+            if task_idx is not None:
+                tasks.finish(
+                    task_idx,
+                    "completed",
+                    data.duration_seconds,
+                    data.tool_calls_used,
+                    data.sources_count,
+                    completed_at=event.timestamp
+                )
             
-            self._session_progress[session_id]["completed_tasks"] += 1
+            self._columns.completed_tasks[idx] += 1
         
-        logger.debug(f"Task {task_id} completed in session {session_id}")
+        logger.debug("Task %s completed in session %s", task_id, session_id)
     
     async def _handle_task_failed(self, event: ResearchTaskFailed) -> None:
         """Track task failure"""
+        data = event.data
         session_id = event.metadata.session_id
         task_id = event.aggregate_id
         
-        if session_id in self._session_progress:
-            if task_id in self._session_progress[session_id]["tasks"]:
-                self._session_progress[session_id]["tasks"][task_id].update({
-                    "status": "failed",
-                    "failed_at": event.timestamp,
-                    "error_message": event.data.get("error_message"),
-                    "error_type": event.data.get("error_type"),
-                    "duration_seconds": event.data.get("duration_seconds")
-                })
+        idx = self._columns.index(session_id)
+        if idx is not None:
+            tasks = self._session_details[session_id]["tasks"]
+            task_idx = tasks.index(task_id)
+            if task_idx is not None:
+                tasks.finish(
+                    task_idx,
+                    "failed",
+                    data.duration_seconds,
+                    data.tool_calls_made,
+                    failed_at=event.timestamp,
+                    error_message=data.error_message,
+                    error_type=data.error_type
+                )
             
-            self._session_progress[session_id]["failed_tasks"] += 1
+            self._columns.failed_tasks[idx] += 1
         
-        logger.warning(f"Task {task_id} failed in session {session_id}: {event.data.get('error_message')}")
+        logger.warning("Task %s failed in session %s: %s", task_id, session_id, data.error_message)
     
     async def _handle_session_completed(self, event: ResearchSessionCompleted) -> None:
         """Track session completion"""
+        data = event.data
         session_id = event.metadata.session_id
         
-        if session_id in self._session_progress:
-            self._session_progress[session_id].update({
-                "status": "completed",
+        idx = self._columns.index(session_id)
+        if idx is not None:
+            self._columns.set_status(idx, "completed")
+            self._session_details[session_id].update({
                 "completed_at": event.timestamp,
-                "total_duration_seconds": event.data.get("total_duration_seconds"),
-                "final_report_length": event.data.get("final_report_length")
+                "total_duration_seconds": data.total_duration_seconds,
+                "final_report_length": data.final_report_length
             })
         
-        logger.info(f"Session {session_id} completed successfully")
+        logger.info("Session %s completed successfully", session_id)
     
     async def _handle_session_cancelled(self, event: ResearchSessionCancelled) -> None:
         """Track session cancellation"""
+        data = event.data
         session_id = event.metadata.session_id
         
-        if session_id in self._session_progress:
-            self._session_progress[session_id].update({
-                "status": "cancelled",
+        idx = self._columns.index(session_id)
+        if idx is not None:
+            self._columns.set_status(idx, "cancelled")
+            self._session_details[session_id].update({
                 "cancelled_at": event.timestamp,
-                "cancellation_reason": event.data.get("reason")
+                "cancellation_reason": data.reason
             })
         
-        logger.info(f"Session {session_id} was cancelled: {event.data.get('reason')}")
+        logger.info("Session %s was cancelled: %s", session_id, data.reason)
+    
+    def _compose_progress(self, session_id: str) -> Dict[str, Any]:
+        """Assemble the progress dict for a session from its row and details"""
+        idx = self._columns.index(session_id)
+        if idx is None:
+            raise KeyError(session_id)
+        columns = self._columns
+        details = self._session_details[session_id]
+        return {
+            "status": columns.statuses[idx],
+            **details,
+            "tasks": details["tasks"].to_dict(),
+            "total_tasks": columns.total_tasks[idx],
+            "completed_tasks": columns.completed_tasks[idx],
+            "failed_tasks": columns.failed_tasks[idx]
+        }
     
-    def get_session_progress(self, session_id: str) -> Dict[str, Any]:
-        """Get progress information for a session"""
-        return self._session_progress.get(session_id, {})
+    def get_session_progress(self, session_id: str) -> Mapping[str, Any]:
+        """Get a read-only view of progress information for a session"""
+        if session_id not in self._columns:
+            return MappingProxyType({})
+        return MappingProxyType(self._compose_progress(session_id))
     
-    def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
-        """Get progress information for all sessions"""
-        return self._session_progress.copy()
+    def get_all_sessions(self, copy: bool = False) -> Mapping[str, Dict[str, Any]]:
+        """
+        Get a read-only view of progress information for all sessions.
+        
+        Pass copy=True for a detached dict snapshot instead.
+        """
+        if copy:
+            return {session_id: self._compose_progress(session_id) for session_id in self._columns}
+        return _SessionProgressView(self)
+    
+    def get_task_rollup(self, session_id: str) -> Dict[str, Any]:
+        """Summarize a session's tasks without composing each task entry"""
+        if session_id not in self._columns:
+            return {}
+        status_counts, mean_duration, total_tool_calls = self._session_details[session_id]["tasks"].rollup()
+        return {
+            "status_counts": status_counts,
+            "average_task_duration": mean_duration,
+            "total_tool_calls": total_tool_calls
+        }
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """Count tracked sessions per status"""
+        return self._columns.status_counts()
+    
+    def get_sessions_by_status(self, status: str) -> List[str]:
+        """Get the IDs of all sessions with a specific status"""
+        return self._columns.ids_with_status(status)
     
     @property
     def event_type(self) -> Type[DomainEvent]:
@@ -176,6 +517,11 @@ class ResearchMetricsCollector(EventHandler):
     and research workflow optimization.
     """
     
+    __slots__ = (
+        "_metrics", "_metrics_view", "_session_duration_stats",
+        "_task_duration_stats", "_dispatch"
+    )
+    
     def __init__(self):
         self._metrics: Dict[str, Any] = {
             "total_sessions": 0,
@@ -187,56 +533,91 @@ class ResearchMetricsCollector(EventHandler):
             "total_tool_calls": 0,
             "average_session_duration": 0.0,
             "average_task_duration": 0.0,
-            "last_updated": None
+            "last_updated": None,  # epoch seconds, formatted by the view on read
+            "session_duration_variance": 0.0,
+            "task_duration_variance": 0.0
+        }
+        # Read-only view handed out by get_metrics()
+        self._metrics_view = _MetricsView(self._metrics)
+        # Running (count, mean, M2) duration stats for Welford's algorithm
+        self._session_duration_stats: Tuple[int, float, float] = (0, 0.0, 0.0)
+        self._task_duration_stats: Tuple[int, float, float] = (0, 0.0, 0.0)
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ResearchSessionStarted: self._handle_session_started,
+            ResearchSessionCompleted: self._handle_session_completed,
+            ResearchSessionCancelled: self._handle_session_cancelled,
+            ResearchTaskStarted: self._handle_task_started,
+            ResearchTaskCompleted: self._handle_task_completed,
+            ResearchTaskFailed: self._handle_task_failed
         }
     
     async def handle(self, event: DomainEvent) -> None:
         """Handle events for metrics collection"""
-        match event:
-            case ResearchSessionStarted():
-                self._metrics["total_sessions"] += 1
-            case ResearchSessionCompleted():
-                self._metrics["completed_sessions"] += 1
-                self._update_session_duration_metric(event.data.get("total_duration_seconds", 0))
-            case ResearchSessionCancelled():
-                self._metrics["cancelled_sessions"] += 1
-            case ResearchTaskStarted():
-                self._metrics["total_tasks"] += 1
-            case ResearchTaskCompleted():
-                self._metrics["completed_tasks"] += 1
-                self._metrics["total_tool_calls"] += event.data.get("tool_calls_used", 0)
-                self._update_task_duration_metric(event.data.get("duration_seconds", 0))
-            case ResearchTaskFailed():
-                self._metrics["failed_tasks"] += 1
-                self._metrics["total_tool_calls"] += event.data.get("tool_calls_made", 0)
+        handler = self._dispatch.get(type(event))
+        if handler is not None:
+            handler(event)
         
-        self._metrics["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._touch()
         
         # Log significant metrics periodically
         if self._metrics["total_sessions"] % 10 == 0:
-            logger.info(f"Metrics update: {self._metrics}")
+            logger.info("Metrics update: %s", self.get_metrics())
+    
+    async def handle_batch(self, events: List[DomainEvent]) -> None:
+        """Handle a batch of events with a single timestamp and log check"""
+        dispatch = self._dispatch
+        for event in events:
+            handler = dispatch.get(type(event))
+            if handler is not None:
+                handler(event)
+        
+        self._touch()
+        
+        if self._metrics["total_sessions"] % 10 == 0:
+            logger.info("Metrics update: %s", self.get_metrics())
+    
+    def _handle_session_started(self, event: ResearchSessionStarted) -> None:
+        self._metrics["total_sessions"] += 1
+    
+    def _handle_session_completed(self, event: ResearchSessionCompleted) -> None:
+        self._metrics["completed_sessions"] += 1
+        self._update_session_duration_metric(event.data.total_duration_seconds)
+    
+    def _handle_session_cancelled(self, event: ResearchSessionCancelled) -> None:
+        self._metrics["cancelled_sessions"] += 1
+    
+    def _handle_task_started(self, event: ResearchTaskStarted) -> None:
+        self._metrics["total_tasks"] += 1
+    
+    def _handle_task_completed(self, event: ResearchTaskCompleted) -> None:
+        data = event.data
+        self._metrics["completed_tasks"] += 1
+        self._metrics["total_tool_calls"] += data.tool_calls_used
+        self._update_task_duration_metric(data.duration_seconds)
+    
+    def _handle_task_failed(self, event: ResearchTaskFailed) -> None:
+        self._metrics["failed_tasks"] += 1
+        self._metrics["total_tool_calls"] += event.data.tool_calls_made
+    
+    def _touch(self) -> None:
+        """Stamp the metrics as updated, once per handled event or batch"""
+        self._metrics["last_updated"] = time.time()
     
     def _update_session_duration_metric(self, duration: float) -> None:
-        """Update average session duration"""
-        completed = self._metrics["completed_sessions"]
-        if completed > 1:
-            current_avg = self._metrics["average_session_duration"]
-            self._metrics["average_session_duration"] = ((current_avg * (completed - 1)) + duration) / completed
-        else:
-            self._metrics["average_session_duration"] = duration
+        """Fold a session duration into the running stats and derived metrics"""
+        stats = self._session_duration_stats = _welford_update(self._session_duration_stats, duration)
+        self._metrics["average_session_duration"] = stats[1]
+        self._metrics["session_duration_variance"] = _welford_variance(stats)
     
     def _update_task_duration_metric(self, duration: float) -> None:
-        """Update average task duration"""
-        completed = self._metrics["completed_tasks"]
-        if completed > 1:
-            current_avg = self._metrics["average_task_duration"]
-            self._metrics["average_task_duration"] = ((current_avg * (completed - 1)) + duration) / completed
-        else:
-            self._metrics["average_task_duration"] = duration
+        """Fold a task duration into the running stats and derived metrics"""
+        stats = self._task_duration_stats = _welford_update(self._task_duration_stats, duration)
+        self._metrics["average_task_duration"] = stats[1]
+        self._metrics["task_duration_variance"] = _welford_variance(stats)
     
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get current metrics"""
-        return self._metrics.copy()
+    def get_metrics(self) -> Mapping[str, Any]:
+        """Get a live, read-only view of the current metrics"""
+        return self._metrics_view
     
     @property
     def event_type(self) -> Type[DomainEvent]:
@@ -255,31 +636,68 @@ class ResearchAuditLogger(EventHandler):
     research activities.
     """
     
-    def __init__(self):
+    __slots__ = ("_max_entries", "_enabled", "_sample_rate", "_audit_log", "_by_session")
+    
+    def __init__(
+        self,
+        max_entries: int = AUDIT_LOG_MAX_ENTRIES,
+        enabled: bool = True,
+        sample_rate: float = 1.0
+    ):
         # In a production system, this would write to a persistent audit log
-        self._audit_log = []
+        self._max_entries = max_entries
+        # A disabled logger drops events before building any entry; a
+        # sample_rate below 1.0 keeps only that fraction of events
+        self._enabled = enabled
+        self._sample_rate = sample_rate
+        self._audit_log: deque = deque()
+        # Same entries grouped per session, in arrival order
+        self._by_session: Dict[Optional[str], deque] = {}
     
     async def handle(self, event: DomainEvent) -> None:
         """Log event to audit trail"""
+        if self._enabled:
+            self._record(event)
+    
+    async def handle_batch(self, events: List[DomainEvent]) -> None:
+        """Log a batch of events to the audit trail"""
+        if self._enabled:
+            for event in events:
+                self._record(event)
+    
+    def _record(self, event: DomainEvent) -> None:
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return
+        
+        meta = event.metadata
         audit_entry = {
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": _epoch_seconds(event.timestamp),  # formatted on read
             "event_id": str(event.event_id),
             "event_type": event.event_type,
             "event_name": event.event_name,
             "aggregate_id": event.aggregate_id,
-            "session_id": event.metadata.session_id,
-            "user_id": event.metadata.user_id,
-            "correlation_id": event.metadata.correlation_id,
-            "source": event.metadata.source,
-            "data": event.data
+            "session_id": meta.session_id,
+            "user_id": meta.user_id,
+            "correlation_id": meta.correlation_id,
+            "source": meta.source,
+            "data": event.data  # payload, copied to a plain dict on read
         }
         
+        # Evict the oldest entry; it is also the oldest of its own session
+        if len(self._audit_log) >= self._max_entries:
+            evicted = self._audit_log.popleft()
+            session_entries = self._by_session[evicted["session_id"]]
+            session_entries.popleft()
+            if not session_entries:
+                del self._by_session[evicted["session_id"]]
+        
         self._audit_log.append(audit_entry)
+        self._by_session.setdefault(audit_entry["session_id"], deque()).append(audit_entry)
         
         # Log to standard logging as well
         logger.info(
-            f"[AUDIT] {event.event_name} | Session: {event.metadata.session_id} | "
-            f"Aggregate: {event.aggregate_id} | User: {event.metadata.user_id}"
+            "[AUDIT] %s | Session: %s | Aggregate: %s | User: %s",
+            event.event_name, meta.session_id, event.aggregate_id, meta.user_id
         )
         
         # In production, you'd also persist this to a database or external audit system
@@ -287,11 +705,18 @@ class ResearchAuditLogger(EventHandler):
     
     def get_audit_log(self, limit: int = 100) -> list:
         """Get recent audit log entries"""
-        return self._audit_log[-limit:] if limit else self._audit_log
+        entries = self._audit_log
+        if limit:
+            entries = islice(entries, max(len(entries) - limit, 0), None)
+        return [self._format_entry(entry) for entry in entries]
     
     def get_session_audit_log(self, session_id: str) -> list:
         """Get audit log entries for a specific session"""
-        return [entry for entry in self._audit_log if entry.get("session_id") == session_id]
+        return [self._format_entry(entry) for entry in self._by_session.get(session_id, ())]
+    
+    @staticmethod
+    def _format_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {**entry, "timestamp": _format_epoch(entry["timestamp"]), "data": dict(entry["data"])}
     
     @property
     def event_type(self) -> Type[DomainEvent]:
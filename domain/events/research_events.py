@@ -5,20 +5,48 @@ This module contains all domain events related to the research workflow.
 These events represent important business occurrences in the research process.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Sequence, Tuple
 
-from .base import DomainEvent, EventMetadata
+from .base import DomainEvent, EventPayload
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last _iso_now() call
+_iso_second: Tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as an ISO-8601 string.
+    
+    Events are stamped in bursts, so the date and time-of-day prefix is
+    formatted once per second and only the microseconds per call.
+    """
+    global _iso_second
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _iso_second
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+@dataclass(frozen=True, slots=True)
+class SessionStartedData(EventPayload):
+    """Payload of ResearchSessionStarted"""
+    query: str
+    project_id: str
+    estimated_duration_minutes: Optional[int]
 
 
-@dataclass(frozen=True)
 class ResearchSessionStarted(DomainEvent):
     """
     Event emitted when a new research session is started.
     
     This event marks the beginning of a research workflow for a specific query.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -29,74 +57,81 @@ class ResearchSessionStarted(DomainEvent):
         estimated_duration_minutes: Optional[int] = None,
         correlation_id: Optional[str] = None
     ):
-        data = {
-            "query": query,
-            "project_id": project_id,
-            "estimated_duration_minutes": estimated_duration_minutes
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            user_id=user_id,
-            session_id=session_id,
-            source="research_orchestrator"
+        data = SessionStartedData(
+            query=query,
+            project_id=project_id,
+            estimated_duration_minutes=estimated_duration_minutes
         )
         
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.session.started",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            session_id, "research.session.started", data,
+            session_id, "research_orchestrator", correlation_id, user_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class PlanGeneratedData(EventPayload):
+    """Payload of ResearchPlanGenerated"""
+    total_tasks: Optional[int]
+    estimated_duration_minutes: Optional[int]
+    research_approach: Optional[str]
+    plan_summary: Optional[str]
+    plan_type: Optional[str]
+    query_analysis: Optional[Dict[str, Any]]
+    revision_number: int
+
+
 class ResearchPlanGenerated(DomainEvent):
     """
     Event emitted when a research plan is generated for a session.
     
-    This event contains the structured plan that will guide the research execution.
+    This event marks the planning phase completion and carries a summary of
+    the plan that will guide the research execution.
     """
+    __slots__ = ()
     
     def __init__(
         self,
         session_id: str,
-        plan_type: str,  # "straightforward", "depth_first", "breadth_first"
         plan_data: Dict[str, Any],
-        query_analysis: Dict[str, Any],
-        revision_number: int = 0,
         correlation_id: Optional[str] = None,
+        plan_type: Optional[str] = None,  # "straightforward", "depth_first", "breadth_first"
+        query_analysis: Optional[Dict[str, Any]] = None,
+        revision_number: int = 0,
         user_id: Optional[str] = None
     ):
-        data = {
-            "plan_type": plan_type,
-            "plan_data": plan_data,
-            "query_analysis": query_analysis,
-            "revision_number": revision_number
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            user_id=user_id,
-            session_id=session_id,
-            source="research_planner"
+        data = PlanGeneratedData(
+            total_tasks=plan_data.get("total_tasks"),
+            estimated_duration_minutes=plan_data.get("estimated_duration_minutes"),
+            research_approach=plan_data.get("research_approach"),
+            plan_summary=plan_data.get("plan_summary"),
+            plan_type=plan_type,
+            query_analysis=query_analysis,
+            revision_number=revision_number
         )
         
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.plan.generated",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            session_id, "research.plan.generated", data,
+            session_id, "research_planner", correlation_id, user_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TaskStartedData(EventPayload):
+    """Payload of ResearchTaskStarted"""
+    task_description: str
+    task_type: str
+    estimated_tool_calls: Optional[int]
+    started_at: str
+
+
 class ResearchTaskStarted(DomainEvent):
     """
     Event emitted when a research task begins execution.
     
     This event marks the start of an individual research task within a session.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -107,74 +142,94 @@ class ResearchTaskStarted(DomainEvent):
         estimated_tool_calls: Optional[int] = None,
         correlation_id: Optional[str] = None
     ):
-        data = {
-            "task_description": task_description,
-            "task_type": task_type,
-            "estimated_tool_calls": estimated_tool_calls,
-            "started_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_worker"
+        data = TaskStartedData(
+            task_description=task_description,
+            task_type=task_type,
+            estimated_tool_calls=estimated_tool_calls,
+            started_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=task_id,
-            event_type="research.task.started",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            task_id, "research.task.started", data,
+            session_id, "research_worker", correlation_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TaskProgressData(EventPayload):
+    """Payload of ResearchTaskProgress"""
+    progress_percentage: float
+    progress_message: str
+    current_action: Optional[str]
+    stage: Optional[str]
+    tools_used: Optional[int]
+    tool_calls_made: int
+    sources_found: Optional[int]
+    progress_points: Tuple[float, ...]
+    progress_at: str
+
+
 class ResearchTaskProgress(DomainEvent):
     """
     Event emitted during research task execution to indicate progress.
     
-    This event provides real-time updates on task progress.
+    This event provides real-time updates on task progress. A single event
+    can stand in for several updates: progress_points lists the percentages
+    reached since the previous event, ending at progress_percentage.
     """
+    __slots__ = ()
     
     def __init__(
         self,
         task_id: str,
         session_id: str,
         progress_percentage: float,
-        stage: str,
-        message: str,
+        progress_message: str,
+        current_action: Optional[str] = None,
+        tools_used: Optional[int] = None,
+        sources_found: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+        stage: Optional[str] = None,
         tool_calls_made: int = 0,
-        correlation_id: Optional[str] = None
+        progress_points: Sequence[float] = ()
     ):
-        data = {
-            "progress_percentage": progress_percentage,
-            "stage": stage,
-            "message": message,
-            "tool_calls_made": tool_calls_made,
-            "progress_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_worker"
+        data = TaskProgressData(
+            progress_percentage=progress_percentage,
+            progress_message=progress_message,
+            current_action=current_action,
+            stage=stage,
+            tools_used=tools_used,
+            tool_calls_made=tool_calls_made,
+            sources_found=sources_found,
+            progress_points=tuple(progress_points),
+            progress_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=task_id,
-            event_type="research.task.progress",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            task_id, "research.task.progress", data,
+            session_id, "research_worker", correlation_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TaskCompletedData(EventPayload):
+    """Payload of ResearchTaskCompleted"""
+    task_description: str
+    research_output: str
+    duration_seconds: float
+    tool_calls_used: int
+    sources_count: int
+    research_verdict: str
+    completed_at: str
+
+
 class ResearchTaskCompleted(DomainEvent):
     """
     Event emitted when a research task completes successfully.
     
     This event contains the results and metadata from the completed task.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -188,37 +243,41 @@ class ResearchTaskCompleted(DomainEvent):
         research_verdict: str = "research_complete",
         correlation_id: Optional[str] = None
     ):
-        data = {
-            "task_description": task_description,
-            "research_output": research_output,
-            "duration_seconds": duration_seconds,
-            "tool_calls_used": tool_calls_used,
-            "sources_count": sources_count,
-            "research_verdict": research_verdict,
-            "completed_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_worker"
+        data = TaskCompletedData(
+            task_description=task_description,
+            research_output=research_output,
+            duration_seconds=duration_seconds,
+            tool_calls_used=tool_calls_used,
+            sources_count=sources_count,
+            research_verdict=research_verdict,
+            completed_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=task_id,
-            event_type="research.task.completed",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            task_id, "research.task.completed", data,
+            session_id, "research_worker", correlation_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TaskFailedData(EventPayload):
+    """Payload of ResearchTaskFailed"""
+    task_description: str
+    error_message: str
+    error_type: str
+    duration_seconds: float
+    tool_calls_made: int
+    retry_count: int
+    failed_at: str
+
+
 class ResearchTaskFailed(DomainEvent):
     """
     Event emitted when a research task fails to complete.
     
     This event contains error information and context for debugging.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -232,80 +291,93 @@ class ResearchTaskFailed(DomainEvent):
         retry_count: int = 0,
         correlation_id: Optional[str] = None
     ):
-        data = {
-            "task_description": task_description,
-            "error_message": error_message,
-            "error_type": error_type,
-            "duration_seconds": duration_seconds,
-            "tool_calls_made": tool_calls_made,
-            "retry_count": retry_count,
-            "failed_at": datetime.utcnow().isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_worker",
-            tags={"error": "true", "retry_count": str(retry_count)}
+        data = TaskFailedData(
+            task_description=task_description,
+            error_message=error_message,
+            error_type=error_type,
+            duration_seconds=duration_seconds,
+            tool_calls_made=tool_calls_made,
+            retry_count=retry_count,
+            failed_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=task_id,
-            event_type="research.task.failed",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            task_id, "research.task.failed", data,
+            session_id, "research_worker", correlation_id,
+            tags=(("error", "true"), ("retry_count", str(retry_count)))
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class JobCompletedData(EventPayload):
+    """Payload of ResearchJobCompleted"""
+    completed_tasks: Tuple[str, ...]
+    failed_tasks: Tuple[str, ...]
+    total_tasks: int
+    success_rate: float
+    total_duration_seconds: float
+    total_tool_calls: int
+    completed_at: str
+
+
 class ResearchJobCompleted(DomainEvent):
     """
     Event emitted when a research job (collection of related tasks) completes.
     
     This event aggregates the results from multiple tasks in a job.
     """
+    __slots__ = ()
     
     def __init__(
         self,
         job_id: str,
         session_id: str,
-        completed_tasks: List[str],
-        failed_tasks: List[str],
+        completed_tasks: Sequence[str],
+        failed_tasks: Sequence[str],
         total_duration_seconds: float,
         total_tool_calls: int,
         correlation_id: Optional[str] = None
     ):
-        data = {
-            "completed_tasks": completed_tasks,
-            "failed_tasks": failed_tasks,
-            "total_tasks": len(completed_tasks) + len(failed_tasks),
-            "success_rate": len(completed_tasks) / (len(completed_tasks) + len(failed_tasks)) if (completed_tasks or failed_tasks) else 0.0,
-            "total_duration_seconds": total_duration_seconds,
-            "total_tool_calls": total_tool_calls,
-            "completed_at": datetime.utcnow().isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_conductor"
+        completed_count = len(completed_tasks)
+        total_tasks = completed_count + len(failed_tasks)
+        data = JobCompletedData(
+            completed_tasks=tuple(completed_tasks),
+            failed_tasks=tuple(failed_tasks),
+            total_tasks=total_tasks,
+            success_rate=completed_count / total_tasks if total_tasks else 0.0,
+            total_duration_seconds=total_duration_seconds,
+            total_tool_calls=total_tool_calls,
+            completed_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=job_id,
-            event_type="research.job.completed",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            job_id, "research.job.completed", data,
+            session_id, "research_conductor", correlation_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SessionCompletedData(EventPayload):
+    """Payload of ResearchSessionCompleted"""
+    query: str
+    project_id: str
+    total_tasks: int
+    successful_tasks: int
+    failed_tasks: int
+    success_rate: float
+    total_duration_seconds: float
+    total_tool_calls: int
+    final_report_length: int
+    completed_at: str
+
+
 class ResearchSessionCompleted(DomainEvent):
     """
     Event emitted when a research session completes successfully.
     
     This event marks the end of the research workflow with final results.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -321,41 +393,42 @@ class ResearchSessionCompleted(DomainEvent):
         correlation_id: Optional[str] = None,
         user_id: Optional[str] = None
     ):
-        data = {
-            "query": query,
-            "project_id": project_id,
-            "total_tasks": total_tasks,
-            "successful_tasks": successful_tasks,
-            "failed_tasks": failed_tasks,
-            "success_rate": successful_tasks / total_tasks if total_tasks > 0 else 0.0,
-            "total_duration_seconds": total_duration_seconds,
-            "total_tool_calls": total_tool_calls,
-            "final_report_length": final_report_length,
-            "completed_at": datetime.utcnow().isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            user_id=user_id,
-            session_id=session_id,
-            source="research_orchestrator"
+        data = SessionCompletedData(
+            query=query,
+            project_id=project_id,
+            total_tasks=total_tasks,
+            successful_tasks=successful_tasks,
+            failed_tasks=failed_tasks,
+            success_rate=successful_tasks / total_tasks if total_tasks > 0 else 0.0,
+            total_duration_seconds=total_duration_seconds,
+            total_tool_calls=total_tool_calls,
+            final_report_length=final_report_length,
+            completed_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.session.completed",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            session_id, "research.session.completed", data,
+            session_id, "research_orchestrator", correlation_id, user_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SessionCancelledData(EventPayload):
+    """Payload of ResearchSessionCancelled"""
+    project_id: str
+    reason: str
+    completed_tasks: int
+    partial_duration_seconds: float
+    cancelled_at: str
+
+
 class ResearchSessionCancelled(DomainEvent):
     """
     Event emitted when a research session is cancelled by the user.
     
     This event indicates that the research was stopped before completion.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -367,36 +440,36 @@ class ResearchSessionCancelled(DomainEvent):
         correlation_id: Optional[str] = None,
         user_id: Optional[str] = None
     ):
-        data = {
-            "project_id": project_id,
-            "reason": reason,
-            "completed_tasks": completed_tasks,
-            "partial_duration_seconds": partial_duration_seconds,
-            "cancelled_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            user_id=user_id,
-            session_id=session_id,
-            source="research_orchestrator"
+        data = SessionCancelledData(
+            project_id=project_id,
+            reason=reason,
+            completed_tasks=completed_tasks,
+            partial_duration_seconds=partial_duration_seconds,
+            cancelled_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.session.cancelled",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            session_id, "research.session.cancelled", data,
+            session_id, "research_orchestrator", correlation_id, user_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class FeedbackReceivedData(EventPayload):
+    """Payload of HumanFeedbackReceived"""
+    feedback_type: str
+    feedback_data: Dict[str, Any]
+    revision_number: int
+    received_at: str
+
+
 class HumanFeedbackReceived(DomainEvent):
     """
     Event emitted when human feedback is received for a research plan.
     
     This event captures user input during the research planning phase.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -407,29 +480,30 @@ class HumanFeedbackReceived(DomainEvent):
         correlation_id: Optional[str] = None,
         user_id: Optional[str] = None
     ):
-        data = {
-            "feedback_type": feedback_type,
-            "feedback_data": feedback_data,
-            "revision_number": revision_number,
-            "received_at": datetime.utcnow().isoformat()
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            user_id=user_id,
-            session_id=session_id,
-            source="human_feedback_manager"
+        data = FeedbackReceivedData(
+            feedback_type=feedback_type,
+            feedback_data=feedback_data,
+            revision_number=revision_number,
+            received_at=_iso_now()
         )
         
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.feedback.received",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            session_id, "research.feedback.received", data,
+            session_id, "human_feedback_manager", correlation_id, user_id
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class FeedbackRequiredData(EventPayload):
+    """Payload of HumanFeedbackRequired"""
+    plan_presentation: str
+    research_plan: Any
+    query_analysis: Dict[str, Any]
+    revision_number: int
+    requires_feedback: bool
+    feedback_deadline: Optional[str]  # Could be added later for timeouts
+
+
 class HumanFeedbackRequired(DomainEvent):
     """
     Event emitted when human feedback is required for a research plan.
@@ -437,6 +511,7 @@ class HumanFeedbackRequired(DomainEvent):
     This event indicates that the system is waiting for user input
     on a generated research plan before proceeding.
     """
+    __slots__ = ()
     
     def __init__(
         self,
@@ -448,110 +523,36 @@ class HumanFeedbackRequired(DomainEvent):
         correlation_id: Optional[str] = None,
         user_id: Optional[str] = None
     ):
-        data = {
-            "plan_presentation": plan_presentation,
-            "research_plan": research_plan,
-            "query_analysis": query_analysis,
-            "revision_number": revision_number,
-            "requires_feedback": True,
-            "feedback_deadline": None  # Could be added later for timeouts
-        }
-        
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            user_id=user_id,
-            session_id=session_id,
-            source="research_orchestrator"
+        data = FeedbackRequiredData(
+            plan_presentation=plan_presentation,
+            research_plan=research_plan,
+            query_analysis=query_analysis,
+            revision_number=revision_number,
+            requires_feedback=True,
+            feedback_deadline=None
         )
         
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="human.feedback.required",
-            data=data,
-            metadata=metadata
-        )
-
-
-@dataclass(frozen=True)
-class ResearchTaskProgress(DomainEvent):
-    """
-    Event emitted during research task execution to show progress.
-    This event provides real-time updates on task completion.
-    """
-
-    def __init__(
-        self,
-        task_id: str,
-        session_id: str,
-        progress_percentage: int,
-        progress_message: str,
-        current_action: Optional[str] = None,
-        tools_used: Optional[int] = None,
-        sources_found: Optional[int] = None,
-        correlation_id: Optional[str] = None
-    ):
-        data = {
-            "progress_percentage": progress_percentage,
-            "progress_message": progress_message,
-            "current_action": current_action,
-            "tools_used": tools_used,
-            "sources_found": sources_found
-        }
-
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_worker"
+        self._init_session_event(
+            session_id, "human.feedback.required", data,
+            session_id, "research_orchestrator", correlation_id, user_id
         )
 
-        super().__init__(
-            aggregate_id=task_id,
-            event_type="research.task.progress",
-            data=data,
-            metadata=metadata
-        )
-
-
-@dataclass(frozen=True)
-class ResearchPlanGenerated(DomainEvent):
-    """
-    Event emitted when a research plan is generated.
-    This event marks the planning phase completion.
-    """
-
-    def __init__(
-        self,
-        session_id: str,
-        plan_data: Dict[str, Any],
-        correlation_id: Optional[str] = None
-    ):
-        data = {
-            "total_tasks": plan_data.get("total_tasks"),
-            "estimated_duration_minutes": plan_data.get("estimated_duration_minutes"),
-            "research_approach": plan_data.get("research_approach"),
-            "plan_summary": plan_data.get("plan_summary")
-        }
-
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_planner"
-        )
 
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.plan.generated",
-            data=data,
-            metadata=metadata
-        )
+@dataclass(frozen=True, slots=True)
+class ReportGeneratedData(EventPayload):
+    """Payload of ResearchReportGenerated"""
+    report_length: Optional[int]
+    sections_count: Optional[int]
+    sources_cited: Optional[int]
+    quality_score: Optional[float]
 
 
-@dataclass(frozen=True)
 class ResearchReportGenerated(DomainEvent):
     """
     Event emitted when a research report is generated.
     This event marks the final output generation phase of research.
     """
+    __slots__ = ()
 
     def __init__(
         self,
@@ -559,22 +560,14 @@ class ResearchReportGenerated(DomainEvent):
         report_data: Dict[str, Any],
         correlation_id: Optional[str] = None
     ):
-        data = {
-            "report_length": report_data.get("report_length"),
-            "sections_count": report_data.get("sections_count"),
-            "sources_cited": report_data.get("sources_cited"),
-            "quality_score": report_data.get("quality_score")
-        }
-
-        metadata = EventMetadata(
-            correlation_id=correlation_id,
-            session_id=session_id,
-            source="research_orchestrator"
+        data = ReportGeneratedData(
+            report_length=report_data.get("report_length"),
+            sections_count=report_data.get("sections_count"),
+            sources_cited=report_data.get("sources_cited"),
+            quality_score=report_data.get("quality_score")
         )
 
-        super().__init__(
-            aggregate_id=session_id,
-            event_type="research.report.generated",
-            data=data,
-            metadata=metadata
+        self._init_session_event(
+            session_id, "research.report.generated", data,
+            session_id, "research_orchestrator", correlation_id
         )
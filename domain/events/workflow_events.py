@@ -3,15 +3,14 @@ Workflow domain events for research workflow management.
 These events track the execution flow of research workflows and task plans.
 """
 
-from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from datetime import datetime
 from .base import DomainEvent
 
 
-@dataclass(frozen=True)
 class ResearchWorkflowStarted(DomainEvent):
     """Emitted when a research workflow begins execution."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, plan_id: str, workflow_type: str = "research_execution", 
                  estimated_duration: Optional[float] = None, total_expected_tasks: Optional[int] = None):
@@ -28,9 +27,9 @@ class ResearchWorkflowStarted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchWorkflowCompleted(DomainEvent):
     """Emitted when a research workflow completes successfully."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, output: str, total_tasks: int, successful_tasks: int, 
                  failed_tasks: int, total_duration: float, workflow_type: str = "research_execution"):
@@ -49,9 +48,9 @@ class ResearchWorkflowCompleted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchWorkflowFailed(DomainEvent):
     """Emitted when a research workflow fails."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, error_message: str, failed_at_task: Optional[str] = None,
                  partial_results: Optional[str] = None, workflow_type: str = "research_execution"):
@@ -68,9 +67,9 @@ class ResearchWorkflowFailed(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchTaskPlanGenerated(DomainEvent):
     """Emitted when a detailed task plan is created from a research plan."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, plan_id: str, task_plan: Dict[str, Any], total_tasks: int,
                  estimated_duration: Optional[float] = None, dependencies: Optional[Dict[str, list]] = None,
@@ -90,9 +89,9 @@ class ResearchTaskPlanGenerated(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchTaskDependencyResolved(DomainEvent):
     """Emitted when a task dependency is resolved and the task can proceed."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, task_id: str, dependency_id: str, resolution_type: str,
                  dependency_result: Optional[str] = None):
@@ -109,9 +108,9 @@ class ResearchTaskDependencyResolved(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchTaskGroupStarted(DomainEvent):
     """Emitted when a group of parallel tasks begins execution."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, group_id: str, task_ids: list[str], group_type: str,
                  estimated_duration: Optional[float] = None):
@@ -128,9 +127,9 @@ class ResearchTaskGroupStarted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchTaskGroupCompleted(DomainEvent):
     """Emitted when a group of parallel tasks completes."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, group_id: str, completed_tasks: int, failed_tasks: int,
                  total_duration: float, group_results: Dict[str, str]):
@@ -148,9 +147,9 @@ class ResearchTaskGroupCompleted(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchWorkflowPaused(DomainEvent):
     """Emitted when a research workflow is paused (e.g., waiting for human feedback)."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, pause_reason: str, paused_at_task: Optional[str] = None,
                  resume_conditions: Optional[list] = None):
@@ -166,9 +165,9 @@ class ResearchWorkflowPaused(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchWorkflowResumed(DomainEvent):
     """Emitted when a paused research workflow resumes."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, resume_reason: str, paused_duration: float,
                  resumed_from_task: Optional[str] = None):
@@ -184,9 +183,9 @@ class ResearchWorkflowResumed(DomainEvent):
         )
 
 
-@dataclass(frozen=True)
 class ResearchWorkflowCancelled(DomainEvent):
     """Emitted when a research workflow is cancelled by the user or system."""
+    __slots__ = ()
     
     def __init__(self, session_id: str, cancellation_reason: str, cancelled_at_task: Optional[str] = None,
                  partial_results: Optional[str] = None, user_id: Optional[str] = None):
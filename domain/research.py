@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Literal, Annotated
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, Discriminator, Tag
+from typing import List, Dict, Any, Optional, Literal, Annotated, Union
 from .tool_call import ToolCall
 
 
 class CompressedResearchOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     findings: str = Field(description="The fully comprehensive findings of the research task")
     tool_calls: List[ToolCall] = Field(description="A list of tool calls made during the research process")
     sources_with_citations: List[Dict[str, str]] = Field(description="A list of dictionaries with key as sources and values as their corresponding citations")
@@ -28,64 +30,113 @@ class FinalResearchReview(BaseModel):
     research_tasks_missing: List[Dict[str, str]] = Field(description="A list of research tasks that are needed for further improvement or that are missing and needs to be completed, with their purposes. The key is the research task, and the value is the purpose of the research task.")
 
 
-class SimpleTask(BaseModel):
+class _TaskBase(BaseModel):
+    """Common base of the task_list entry models"""
+    model_config = ConfigDict(frozen=True)
+
+
+class SimpleTask(_TaskBase):
     task_type: Literal["Simple_Task"] = "Simple_Task"
     task_desc: str = Field(description="The description of the research task")
 
 
-class DependentTask(BaseModel):
+class DependentTask(_TaskBase):
     task_type: Literal["Dependent_Task"] = "Dependent_Task"
     tasks: List[str] = Field(description="The list of dependent research tasks to be executed")
 
 
-class ComplexTask(BaseModel):
+class ComplexTask(_TaskBase):
     task_type: Literal["Complex_Task"] = "Complex_Task"
     independent_tasks: List[str] = Field(description="The list of independent research tasks to be executed")
     dependent_tasks: List[DependentTask] = Field(description="The list of dependent research tasks to be executed")
 
 
+def _task_type_tag(value: Any) -> str:
+    """Pick the task model for a task_list entry, inferring it when task_type is omitted"""
+    if not isinstance(value, dict):
+        return value.task_type
+    if "task_type" in value:
+        return value["task_type"]
+    if "independent_tasks" in value:
+        return "Complex_Task"
+    if "tasks" in value:
+        return "Dependent_Task"
+    return "Simple_Task"
+
+
+# Tagged union: each entry is validated against one model, not tried against all three
+_TaskListEntry = Annotated[
+    Union[
+        Annotated[SimpleTask, Tag("Simple_Task")],
+        Annotated[DependentTask, Tag("Dependent_Task")],
+        Annotated[ComplexTask, Tag("Complex_Task")],
+    ],
+    Discriminator(_task_type_tag),
+]
+
+
 class ProcessedJob(BaseModel):
     job_desc: str = Field(description="The description of the research job")
-    task_list: List[SimpleTask | DependentTask | ComplexTask] = Field(description="The list of research tasks to be executed")
-    tool_call_budget: int = Field(description="The number of tool calls to be used to complete the research task")
+    task_list: List[_TaskListEntry] = Field(description="The list of research tasks to be executed")
+    tool_call_budget: int = Field(ge=1, description="The number of tool calls to be used to complete the research task")
 
 
 class ResearchActionPlan(BaseModel):
     research_tasks: List[ProcessedJob] = Field(description="The list of research tasks to be executed")
 
 
+# Built once so repeated validation reuses the same pydantic-core validator
+_COMPLETED_TASKS_ADAPTER = TypeAdapter(List[CompletedResearchTask])
+
+
+def validate_completed_tasks(raw: Union[str, bytes, List[Any]]) -> List[CompletedResearchTask]:
+    """Validate completed research tasks from a JSON string or Python objects"""
+    if isinstance(raw, (str, bytes)):
+        return _COMPLETED_TASKS_ADAPTER.validate_json(raw)
+    return _COMPLETED_TASKS_ADAPTER.validate_python(raw)
+
+
+def validate_action_plan(raw: Union[str, bytes, Dict[str, Any]]) -> ResearchActionPlan:
+    """Validate a research action plan from a JSON string or Python objects"""
+    if isinstance(raw, (str, bytes)):
+        return ResearchActionPlan.model_validate_json(raw)
+    return ResearchActionPlan.model_validate(raw)
+
+
 class ResearchOutput(BaseModel):
     research_output: str = Field(description="The output of the research task")
 
 
 class PlanElement(BaseModel):
-    description: str = Annotated[str, "A clear description of the plan step"]
-    should_decompose: bool = Annotated[bool, "Whether this step should be decomposed into smaller steps"]
-    sub_steps: Optional[List[str]] = Annotated[Optional[List[str]], "A list of sub-steps that need to be taken to complete this step"]
-    expected_output: Optional[str] = Annotated[Optional[str], "A clear description of the expected output from this step"]
-    is_strictly_necessary: bool = Annotated[bool, "Whether this step is strictly necessary to answer the user's query well"]    
+    model_config = ConfigDict(frozen=True)
+    
+    description: str = Field(description="A clear description of the plan step")
+    should_decompose: bool = Field(description="Whether this step should be decomposed into smaller steps")
+    sub_steps: Optional[List[str]] = Field(default=None, description="A list of sub-steps that need to be taken to complete this step")
+    expected_output: Optional[str] = Field(default=None, description="A clear description of the expected output from this step")
+    is_strictly_necessary: bool = Field(description="Whether this step is strictly necessary to answer the user's query well")
 
 
 class StraightforwardResearchPlan(BaseModel):
-    direct_path: str = Annotated[str, "A direct path to the answer"]
-    fact_finding_steps: Optional[List[str]] = Annotated[Optional[List[str]], "A list of fact-finding steps that need to be taken to answer the query"]
-    key_data_points: Optional[List[str]] = Annotated[Optional[List[str]], "A list of key data points that need to be found to answer the query"]
-    sources_to_use: Optional[List[str]] = Annotated[Optional[List[str]], "A list of sources that need to be used to answer the query"]
-    verification_steps: Optional[List[str]] = Annotated[Optional[List[str]], "A list of verification steps that need to be taken to ensure the accuracy of the answer"]
-    plan_elements: Optional[List[PlanElement]] = Annotated[Optional[List[PlanElement]], "A list of plan elements that need to be addressed to answer the query"]
+    direct_path: str = Field(description="A direct path to the answer")
+    fact_finding_steps: Optional[List[str]] = Field(default=None, description="A list of fact-finding steps that need to be taken to answer the query")
+    key_data_points: Optional[List[str]] = Field(default=None, description="A list of key data points that need to be found to answer the query")
+    sources_to_use: Optional[List[str]] = Field(default=None, description="A list of sources that need to be used to answer the query")
+    verification_steps: Optional[List[str]] = Field(default=None, description="A list of verification steps that need to be taken to ensure the accuracy of the answer")
+    plan_elements: Optional[List[PlanElement]] = Field(default=None, description="A list of plan elements that need to be addressed to answer the query")
 
 
 class DepthFirstResearchPlan(BaseModel):
-    approaches: List[str] = Annotated[List[str], "A list of 3-5 different methodological approaches or perspectives"]
-    expert_viewpoints: List[str] = Annotated[List[str], "A list of specific expert viewpoints or sources of evidence that would enrich the analysis"]
-    synthesis_method: str = Annotated[str, "A clear plan for how findings from different approaches will be synthesized"]
+    approaches: List[str] = Field(default_factory=list, description="A list of 3-5 different methodological approaches or perspectives")
+    expert_viewpoints: List[str] = Field(default_factory=list, description="A list of specific expert viewpoints or sources of evidence that would enrich the analysis")
+    synthesis_method: str = Field(description="A clear plan for how findings from different approaches will be synthesized")
 
 
 class BreadthFirstResearchPlan(BaseModel):
-    sub_questions: List[str] = Annotated[List[str], "A list of all the distinct sub-questions or sub-tasks that can be researched independently to answer the query"]
-    critical_sub_questions: List[str] = Annotated[List[str], "A list of the most critical sub-questions or perspectives needed to answer the query comprehensively"]
-    sub_agent_boundaries: Dict[str, str] = Annotated[Dict[str, str], "A dictionary of extremely clear, crisp, and understandable boundaries between sub-topics to prevent overlap"]
-    aggregation_method: str = Annotated[str, "A clear plan for how findings will be aggregated into a coherent whole"]
+    sub_questions: List[str] = Field(default_factory=list, description="A list of all the distinct sub-questions or sub-tasks that can be researched independently to answer the query")
+    critical_sub_questions: List[str] = Field(default_factory=list, description="A list of the most critical sub-questions or perspectives needed to answer the query comprehensively")
+    sub_agent_boundaries: Dict[str, str] = Field(default_factory=dict, description="A dictionary of extremely clear, crisp, and understandable boundaries between sub-topics to prevent overlap")
+    aggregation_method: str = Field(description="A clear plan for how findings will be aggregated into a coherent whole")
 
 
 class Feedback(BaseModel):
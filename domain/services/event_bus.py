@@ -25,7 +25,12 @@ class DomainEventBus(EventPublisher):
     
     @abstractmethod
     async def publish_many(self, events: List[DomainEvent]) -> None:
-        """Publish multiple domain events atomically"""
+        """
+        Publish multiple domain events in a single awaited fan-out.
+        
+        Implementations should dispatch the whole batch concurrently (one
+        gather across handlers) rather than awaiting each event in turn.
+        """
         pass
     
     @abstractmethod
@@ -4,12 +4,14 @@ Tool call domain model.
 This module contains the tool call model used in research outputs.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any, Optional
 
 
 class ToolCall(BaseModel):
     """Represents a tool call made during research"""
+    model_config = ConfigDict(frozen=True)
+    
     tool_name: str = Field(description="Name of the tool that was called")
     arguments: Dict[str, Any] = Field(description="Arguments passed to the tool")
     result: Optional[str] = Field(default=None, description="Result returned by the tool")
@@ -1,19 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any
 
-
-class ToolCall(BaseModel):
-    tool_name: str = Field(description="The name of the tool that was called")
-    tool_arguments: List[Dict[str, str]] = Field(
-        description="The inputs to the tool calls as a list of dictionaries with key as the input name and value as the input value for each tool call"
-    )
-    number_of_calls: int = Field(description="The number of times the tool was called")
+# Single ToolCall model shared with research outputs
+from .tool_call import ToolCall
 
 
 class ParallelToolCall(BaseModel):
     tool_name: str = Field(description="The name of the tool to call")
     tool_args: List[Dict[str, Any]] = Field(description="The list of tool arguments to pass to the all tool calls")
-    parallel_workers: int = Field(description="The number of parallel workers to use for the tool call (must match the number of tool calls argument sets in the tool_args list)", default=1)
+    parallel_workers: int = Field(description="The number of parallel workers to use for the tool call (must match the number of tool calls argument sets in the tool_args list)", default=1, ge=1)
 
 
 class ParallelToolCallConfig(BaseModel):
@@ -21,6 +16,8 @@ class ParallelToolCallConfig(BaseModel):
 
 
 class ToolCallResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     tool_call_id: str = Field(description="The id of the tool call")
     tool_name: str = Field(description="The name of the tool that was called")
     tool_result: Any = Field(description="The result of the tool call")
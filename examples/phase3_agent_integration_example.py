@@ -8,8 +8,10 @@ WebSocket clients receive real-time updates.
 
 import asyncio
 import logging
+import os
 import uuid
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 # Import the event-driven infrastructure
@@ -35,6 +37,23 @@ from domain.events import (
     ResearchSessionCompleted
 )
 
+
+def _uuid_pool(size: int = 256):
+    """Yield random UUID strings, drawing the entropy for a whole batch at once"""
+    while True:
+        entropy = os.urandom(16 * size)
+        for offset in range(0, len(entropy), 16):
+            yield str(uuid.UUID(bytes=entropy[offset:offset + 16], version=4))
+
+
+_next_uuid = _uuid_pool().__next__
+
+# Planning-phase event classes by name
+_EVENT_CLASSES = {
+    "ResearchPlanGenerated": ResearchPlanGenerated,
+    "ResearchWorkflowStarted": ResearchWorkflowStarted,
+}
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -60,8 +79,8 @@ class Phase3IntegrationDemo:
         """Initialize the Phase 3 integration demo."""
         logger.info("🚀 Initializing Phase 3: Agent Integration Demo...")
         
-        # Create event bus
-        self.event_bus = EventBusFactory.create_simple_event_bus()
+        # Create event bus; events published within 5 ms go out as one batch
+        self.event_bus = EventBusFactory.create_queued_event_bus(batch_window_seconds=0.005)
         
         # Create WebSocket manager
         self.websocket_manager = ResearchWebSocketManager()
@@ -148,6 +167,9 @@ class Phase3IntegrationDemo:
             # Step 4: Emit completion events
             await self._emit_completion_events()
             
+            # Let the bus finish delivering to WebSocket handlers
+            await self.event_bus.join()
+            
             logger.info("✅ Research workflow completed successfully")
             
         except Exception as e:
@@ -160,7 +182,7 @@ class Phase3IntegrationDemo:
         
         event = ResearchSessionStarted(
             aggregate_id=self.session_id,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=_next_uuid(),
             event_type="research_session_started",
             timestamp=datetime.now(),
             version=1,
@@ -176,9 +198,6 @@ class Phase3IntegrationDemo:
         
         await self.event_bus.publish(event)
         logger.info("✅ ResearchSessionStarted event emitted")
-        
-        # Wait for WebSocket processing
-        await asyncio.sleep(0.1)
     
     async def _emit_planning_events(self):
         """Emit planning phase events."""
@@ -192,7 +211,7 @@ class Phase3IntegrationDemo:
                 "metadata": {"planning_agent": "research_orchestrator"}
             }),
             ("ResearchWorkflowStarted", {
-                "plan_id": str(uuid.uuid4()),
+                "plan_id": _next_uuid(),
                 "workflow_type": "research_execution",
                 "estimated_duration": 300.0
             })
@@ -202,10 +221,10 @@ class Phase3IntegrationDemo:
             logger.info(f"📡 Emitting {event_type} event...")
             
             # Create and emit the event
-            event_class = globals()[event_type]
+            event_class = _EVENT_CLASSES[event_type]
             event = event_class(
                 aggregate_id=self.session_id,
-                correlation_id=str(uuid.uuid4()),
+                correlation_id=_next_uuid(),
                 event_type=event_type.lower(),
                 timestamp=datetime.now(),
                 version=1,
@@ -215,9 +234,6 @@ class Phase3IntegrationDemo:
             
             await self.event_bus.publish(event)
             logger.info(f"✅ {event_type} event emitted")
-            
-            # Wait for WebSocket processing
-            await asyncio.sleep(0.2)
     
     async def _emit_workflow_events(self):
         """Emit workflow execution events."""
@@ -234,45 +250,45 @@ class Phase3IntegrationDemo:
         for task in tasks:
             logger.info(f"📡 Emitting task events for {task['name']}...")
             
+            # One timestamp for the whole batch published below
+            emitted_at = datetime.now(timezone.utc)
+            
             # Task started
             from domain.events.research_events import ResearchTaskStarted
             task_started_event = ResearchTaskStarted(
                 aggregate_id=self.session_id,
-                correlation_id=str(uuid.uuid4()),
+                correlation_id=_next_uuid(),
                 event_type="research_task_started",
-                timestamp=datetime.now(),
+                timestamp=emitted_at,
                 version=1,
                 session_id=self.session_id,
                 task_id=task["id"],
                 task_name=task["name"],
                 description=f"Executing {task['name']} for Phase 3 integration demo"
             )
-            await self.event_bus.publish(task_started_event)
             
-            # Task progress (simulate multiple progress updates)
+            # Task progress (one event carrying every progress point)
             from domain.events.research_events import ResearchTaskProgress
-            for progress in [25, 50, 75, 100]:
-                progress_event = ResearchTaskProgress(
-                    aggregate_id=self.session_id,
-                    correlation_id=str(uuid.uuid4()),
-                    event_type="research_task_progress",
-                    timestamp=datetime.now(),
-                    version=1,
-                    session_id=self.session_id,
-                    task_id=task["id"],
-                    progress_percentage=progress,
-                    current_action=f"Processing {task['name']} - {progress}% complete"
-                )
-                await self.event_bus.publish(progress_event)
-                await asyncio.sleep(0.1)  # Simulate processing time
+            progress_event = ResearchTaskProgress(
+                aggregate_id=self.session_id,
+                correlation_id=_next_uuid(),
+                event_type="research_task_progress",
+                timestamp=emitted_at,
+                version=1,
+                session_id=self.session_id,
+                task_id=task["id"],
+                progress_percentage=100,
+                progress_points=[25, 50, 75, 100],
+                current_action=f"Processing {task['name']} - 100% complete"
+            )
             
             # Task completed
             from domain.events.research_events import ResearchTaskCompleted
             task_completed_event = ResearchTaskCompleted(
                 aggregate_id=self.session_id,
-                correlation_id=str(uuid.uuid4()),
+                correlation_id=_next_uuid(),
                 event_type="research_task_completed",
-                timestamp=datetime.now(),
+                timestamp=emitted_at,
                 version=1,
                 session_id=self.session_id,
                 task_id=task["id"],
@@ -280,10 +296,11 @@ class Phase3IntegrationDemo:
                 duration=task["duration"],
                 metadata={"demo_task": True}
             )
-            await self.event_bus.publish(task_completed_event)
+            
+            # One fan-out per task instead of one awaited publish per event
+            await self.event_bus.publish_many([task_started_event, progress_event, task_completed_event])
             
             logger.info(f"✅ Task {task['name']} completed")
-            await asyncio.sleep(0.2)
     
     async def _emit_completion_events(self):
         """Emit completion events."""
@@ -292,7 +309,7 @@ class Phase3IntegrationDemo:
         # Workflow completed
         workflow_completed_event = ResearchWorkflowCompleted(
             aggregate_id=self.session_id,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=_next_uuid(),
             event_type="research_workflow_completed",
             timestamp=datetime.now(),
             version=1,
@@ -309,7 +326,7 @@ class Phase3IntegrationDemo:
         # Session completed
         session_completed_event = ResearchSessionCompleted(
             aggregate_id=self.session_id,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=_next_uuid(),
             event_type="research_session_completed",
             timestamp=datetime.now(),
             version=1,
@@ -333,7 +350,7 @@ class Phase3IntegrationDemo:
         from domain.events.workflow_events import ResearchWorkflowFailed
         error_event = ResearchWorkflowFailed(
             aggregate_id=self.session_id,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=_next_uuid(),
             event_type="research_workflow_failed",
             timestamp=datetime.now(),
             version=1,
@@ -407,7 +424,8 @@ class MockWebSocket:
     def __init__(self, client_id: str):
         self.client_id = client_id
         self.message_count = 0
-        self.messages = []
+        # Keep only the most recent frames; message_count tracks the total
+        self.messages = deque(maxlen=1024)
     
     async def send_text(self, message: str):
         """Mock send_text method."""
@@ -429,7 +447,7 @@ async def main():
         await demo.initialize()
         
         # Generate session ID
-        demo.session_id = str(uuid.uuid4())
+        demo.session_id = _next_uuid()
         logger.info(f"🎯 Demo session ID: {demo.session_id}")
         
         # Simulate WebSocket clients
@@ -10,6 +10,10 @@ import asyncio
 import json
 import logging
 from typing import Dict, Any
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from infrastructure.events.simple_event_bus import SimpleEventBus
 from infrastructure.websockets.websocket_manager import ResearchWebSocketManager
@@ -151,4 +155,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's libuv-based event loop when installed, the stdlib loop otherwise
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(main())
@@ -15,6 +15,10 @@ import logging
 from pathlib import Path
 from uuid import uuid4
 import sys
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -367,5 +371,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    # uvloop's libuv-based event loop when installed, the stdlib loop otherwise
+    run = uvloop.run if uvloop is not None else asyncio.run
+    exit_code = run(main())
     sys.exit(exit_code)
@@ -5,9 +5,12 @@ This package provides event bus implementations with enhanced
 Langfuse observability integration.
 """
 
-from .simple_event_bus import SimpleEventBus, EventBusFactory
+from .simple_event_bus import SimpleEventBus, QueuedEventBus, EventBusFactory
+from .progress_batcher import ProgressBatcher
 
 __all__ = [
     "SimpleEventBus", 
-    "EventBusFactory"
+    "QueuedEventBus",
+    "EventBusFactory",
+    "ProgressBatcher"
 ]
@@ -0,0 +1,107 @@
+"""
+Coalescing publisher for research task progress.
+
+Research workers can report progress far more often than the UI needs it.
+ProgressBatcher keeps only the latest update per task and publishes those
+on a fixed tick, so a chatty task costs one event per interval instead of
+one event per report.
+"""
+
+import logging
+import asyncio
+from typing import Any, Dict, Optional
+
+from domain.events.base import EventBus
+from domain.events.research_events import ResearchTaskProgress
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressBatcher:
+    """
+    Publishes at most one ResearchTaskProgress per task per interval.
+    
+    Updates submitted between ticks are folded into one event per task: it
+    carries the most recent update, with every percentage reported since the
+    last tick in progress_points. Completion (100%) is published
+    immediately, and workers should call flush_task() before emitting a
+    terminal event such as ResearchTaskFailed so the last progress update is
+    not delivered after it.
+    """
+    __slots__ = ("_event_bus", "_interval", "_pending", "_flush_task")
+    
+    def __init__(self, event_bus: EventBus, interval_seconds: float = 0.1):
+        self._event_bus = event_bus
+        self._interval = interval_seconds
+        # task_id -> keyword arguments of the latest ResearchTaskProgress
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start the periodic flush loop"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def stop(self) -> None:
+        """Stop the flush loop and publish anything still pending"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+    
+    async def submit(
+        self,
+        task_id: str,
+        session_id: str,
+        progress_percentage: float,
+        progress_message: str,
+        **details: Any
+    ) -> None:
+        """
+        Record a progress update for a task.
+        
+        Accepts the same arguments as ResearchTaskProgress. The event itself is
+        only built when the update is published.
+        """
+        pending = self._pending.get(task_id)
+        points = pending["progress_points"] if pending is not None else ()
+        self._pending[task_id] = dict(
+            task_id=task_id,
+            session_id=session_id,
+            progress_percentage=progress_percentage,
+            progress_message=progress_message,
+            progress_points=points + (progress_percentage,),
+            **details
+        )
+        if progress_percentage >= 100:
+            await self.flush_task(task_id)
+    
+    async def flush_task(self, task_id: str) -> None:
+        """Publish the pending update for one task, if any"""
+        kwargs = self._pending.pop(task_id, None)
+        if kwargs is not None:
+            await self._event_bus.publish(ResearchTaskProgress(**kwargs))
+    
+    async def flush(self) -> None:
+        """Publish the pending update for every task"""
+        if not self._pending:
+            return
+        # Swap the map out before awaiting so submissions made while handlers
+        # run land in the next tick rather than being lost or mutated mid-walk
+        pending, self._pending = self._pending, {}
+        await self._event_bus.publish_many(
+            [ResearchTaskProgress(**kwargs) for kwargs in pending.values()]
+        )
+    
+    async def _flush_loop(self) -> None:
+        """Publish coalesced progress once per interval"""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing task progress: {e}")
@@ -8,7 +8,7 @@ through decorators and native integration.
 
 import logging
 import asyncio
-from typing import List, Dict, Type, Optional
+from typing import List, Dict, Tuple, Type, Optional
 
 from domain.events.base import DomainEvent, EventHandler
 
@@ -27,6 +27,9 @@ class SimpleEventBus:
     
     def __init__(self):
         self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = {}
+        # event type -> its handlers plus catch-all handlers, priority-sorted;
+        # rebuilt lazily after any subscription change
+        self._dispatch_table: Dict[Type[DomainEvent], Tuple[EventHandler, ...]] = {}
         self._running = False
         logger.info("SimpleEventBus initialized")
     
@@ -34,28 +37,49 @@ class SimpleEventBus:
         """Publish an event to all registered handlers"""
         if not self._running:
             raise RuntimeError("Event bus is not running")
+        await self._dispatch(event)
+    
+    async def publish_many(self, events: List[DomainEvent]) -> None:
+        """Publish multiple events, handing each handler its events as one batch"""
+        if not self._running:
+            raise RuntimeError("Event bus is not running")
+        await self._dispatch_many(events)
+    
+    async def _dispatch(self, event: DomainEvent) -> None:
+        """Run every applicable handler for one event"""
+        handlers = self._handlers_for(type(event))
         
-        # Get applicable handlers
-        event_type = type(event)
-        specific_handlers = self._handlers.get(event_type, [])
-        base_handlers = self._handlers.get(DomainEvent, [])
-        all_handlers = specific_handlers + base_handlers
-        
-        if all_handlers:
-            # Sort handlers by priority
-            sorted_handlers = sorted(all_handlers, key=lambda h: h.priority.value, reverse=True)
-            
+        if handlers:
             # Execute handlers concurrently
             # Note: Each handler decorated with @observe will automatically create spans
-            tasks = [handler.handle(event) for handler in sorted_handlers]
+            tasks = [handler.handle(event) for handler in handlers]
             await asyncio.gather(*tasks, return_exceptions=True)
         
         logger.debug(f"Published event: {event.event_name}")
     
-    async def publish_many(self, events: List[DomainEvent]) -> None:
-        """Publish multiple events"""
+    async def _dispatch_many(self, events: List[DomainEvent]) -> None:
+        """Run every applicable handler once over its share of the events"""
+        # Group per handler, keeping each handler's events in publish order
+        batches: Dict[EventHandler, List[DomainEvent]] = {}
         for event in events:
-            await self.publish(event)
+            for handler in self._handlers_for(type(event)):
+                batches.setdefault(handler, []).append(event)
+        
+        if batches:
+            sorted_handlers = sorted(batches, key=lambda h: h.priority.value, reverse=True)
+            tasks = [handler.handle_batch(batches[handler]) for handler in sorted_handlers]
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        logger.debug(f"Published {len(events)} events")
+    
+    def _handlers_for(self, event_type: Type[DomainEvent]) -> Tuple[EventHandler, ...]:
+        """Handlers for an event type, highest priority first"""
+        handlers = self._dispatch_table.get(event_type)
+        if handlers is None:
+            all_handlers = self._handlers.get(event_type, []) + self._handlers.get(DomainEvent, [])
+            handlers = tuple(sorted(all_handlers, key=lambda h: h.priority.value, reverse=True))
+            self._dispatch_table[event_type] = handlers
+        return handlers
     
     def subscribe(self, handler: EventHandler) -> None:
         """Subscribe an event handler"""
@@ -63,6 +87,7 @@ class SimpleEventBus:
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        self._dispatch_table.clear()
         
         logger.debug(f"Subscribed handler {handler.__class__.__name__} for {event_type.__name__}")
     
@@ -72,6 +97,7 @@ class SimpleEventBus:
         if event_type in self._handlers:
             try:
                 self._handlers[event_type].remove(handler)
+                self._dispatch_table.clear()
                 logger.debug(f"Unsubscribed handler {handler.__class__.__name__} for {event_type.__name__}")
             except ValueError:
                 logger.warning(f"Handler {handler.__class__.__name__} was not subscribed")
@@ -90,12 +116,90 @@ class SimpleEventBus:
         """Get the number of handlers for an event type"""
         return len(self._handlers.get(event_type, []))
     
+    @property
+    def handlers(self) -> Tuple[EventHandler, ...]:
+        """All subscribed handlers"""
+        return tuple(handler for handlers in self._handlers.values() for handler in handlers)
+    
     @property
     def is_running(self) -> bool:
         """Check if the event bus is running"""
         return self._running
 
 
+class QueuedEventBus(SimpleEventBus):
+    """
+    Event bus that delivers events from a background pump.
+    
+    publish() only enqueues the event and returns, so producers keep running
+    while slow handlers (e.g. WebSocket sends) are still in flight. The pump
+    drains everything queued since its last pass and delivers it as one
+    batch, preserving publish order per handler. With a batch window the
+    pump waits that long after the first event so bursts arriving together
+    are delivered together.
+    """
+    
+    def __init__(self, batch_window_seconds: float = 0.0):
+        super().__init__()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pump_task: Optional[asyncio.Task] = None
+        self._batch_window = batch_window_seconds
+    
+    async def publish(self, event: DomainEvent) -> None:
+        """Queue an event for delivery"""
+        if not self._running:
+            raise RuntimeError("Event bus is not running")
+        self._queue.put_nowait(event)
+    
+    async def publish_many(self, events: List[DomainEvent]) -> None:
+        """Queue multiple events for delivery"""
+        if not self._running:
+            raise RuntimeError("Event bus is not running")
+        for event in events:
+            self._queue.put_nowait(event)
+    
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered"""
+        await self._queue.join()
+    
+    async def start(self) -> None:
+        """Start the event bus and its delivery pump"""
+        await super().start()
+        if self._pump_task is None:
+            self._pump_task = asyncio.create_task(self._pump())
+    
+    async def stop(self) -> None:
+        """Deliver queued events, then stop the event bus"""
+        if self._pump_task is not None:
+            await self._queue.join()
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except asyncio.CancelledError:
+                pass
+            self._pump_task = None
+        await super().stop()
+    
+    async def _pump(self) -> None:
+        """Deliver queued events until cancelled"""
+        while True:
+            events = [await self._queue.get()]
+            if self._batch_window:
+                await asyncio.sleep(self._batch_window)
+            while not self._queue.empty():
+                events.append(self._queue.get_nowait())
+            try:
+                if len(events) == 1:
+                    await self._dispatch(events[0])
+                else:
+                    await self._dispatch_many(events)
+            except Exception as e:
+                logger.error(f"Error delivering queued events: {e}")
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+
 class EventBusFactory:
     """Factory for creating simple event buses"""
     
@@ -104,6 +208,11 @@ class EventBusFactory:
         """Create a simple event bus"""
         return SimpleEventBus()
     
+    @staticmethod
+    def create_queued_event_bus(batch_window_seconds: float = 0.0) -> QueuedEventBus:
+        """Create an event bus that delivers events off the publish path"""
+        return QueuedEventBus(batch_window_seconds)
+    
     @staticmethod
     def create_event_bus_with_telemetry(telemetry_manager=None) -> SimpleEventBus:
         """
@@ -80,13 +80,13 @@ class ResearchSessionWebSocketHandler(EventHandler):
         message = {
             "type": "session_started",
             "session_id": session_id,
-            "query": event.data.get("query"),
-            "project_id": event.data.get("project_id"),
-            "estimated_duration": event.data.get("estimated_duration_minutes"),
-            "timestamp": event.timestamp.isoformat(),
+            "query": event.data.query,
+            "project_id": event.data.project_id,
+            "estimated_duration": event.data.estimated_duration_minutes,
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Research Session Started",
-                "message": f"Starting research: {event.data.get('query', 'Unknown query')}",
+                "message": f"Starting research: {event.data.query}",
                 "status": "started",
                 "progress": 0,
                 "show_notification": True,
@@ -104,24 +104,24 @@ class ResearchSessionWebSocketHandler(EventHandler):
         message = {
             "type": "session_completed",
             "session_id": session_id,
-            "total_tasks": event.data.get("total_tasks"),
-            "successful_tasks": event.data.get("successful_tasks"),
-            "failed_tasks": event.data.get("failed_tasks"),
-            "total_duration": event.data.get("total_duration_seconds"),
-            "final_report_length": event.data.get("final_report_length"),
-            "timestamp": event.timestamp.isoformat(),
+            "total_tasks": event.data.total_tasks,
+            "successful_tasks": event.data.successful_tasks,
+            "failed_tasks": event.data.failed_tasks,
+            "total_duration": event.data.total_duration_seconds,
+            "final_report_length": event.data.final_report_length,
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Research Completed",
-                "message": f"Research completed successfully with {event.data.get('successful_tasks', 0)} tasks",
+                "message": f"Research completed successfully with {event.data.successful_tasks} tasks",
                 "status": "completed",
                 "progress": 100,
                 "show_notification": True,
                 "notification_type": "success",
                 "show_summary": True,
                 "summary": {
-                    "total_tasks": event.data.get("total_tasks", 0),
-                    "duration": f"{event.data.get('total_duration_seconds', 0):.1f}s",
-                    "report_length": f"{event.data.get('final_report_length', 0)} characters"
+                    "total_tasks": event.data.total_tasks,
+                    "duration": f"{event.data.total_duration_seconds:.1f}s",
+                    "report_length": f"{event.data.final_report_length} characters"
                 }
             }
         }
@@ -136,11 +136,11 @@ class ResearchSessionWebSocketHandler(EventHandler):
         message = {
             "type": "session_cancelled",
             "session_id": session_id,
-            "reason": event.data.get("reason"),
-            "timestamp": event.timestamp.isoformat(),
+            "reason": event.data.reason,
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Research Cancelled",
-                "message": f"Research cancelled: {event.data.get('reason', 'Unknown reason')}",
+                "message": f"Research cancelled: {event.data.reason}",
                 "status": "cancelled",
                 "progress": 0,
                 "show_notification": True,
@@ -185,12 +185,12 @@ class ResearchTaskWebSocketHandler(EventHandler):
             "type": "task_started",
             "session_id": session_id,
             "task_id": event.aggregate_id,
-            "task_description": event.data.get("task_description"),
-            "estimated_tool_calls": event.data.get("estimated_tool_calls"),
-            "timestamp": event.timestamp.isoformat(),
+            "task_description": event.data.task_description,
+            "estimated_tool_calls": event.data.estimated_tool_calls,
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Task Started",
-                "message": event.data.get("task_description", "Task started"),
+                "message": event.data.task_description,
                 "status": "in_progress",
                 "progress": 20,
                 "show_in_timeline": True,
@@ -209,15 +209,15 @@ class ResearchTaskWebSocketHandler(EventHandler):
             "type": "task_completed",
             "session_id": session_id,
             "task_id": event.aggregate_id,
-            "task_description": event.data.get("task_description"),
-            "duration": event.data.get("duration_seconds"),
-            "tool_calls_used": event.data.get("tool_calls_used"),
-            "sources_count": event.data.get("sources_count"),
-            "output_length": len(event.data.get("research_output", "")),
-            "timestamp": event.timestamp.isoformat(),
+            "task_description": event.data.task_description,
+            "duration": event.data.duration_seconds,
+            "tool_calls_used": event.data.tool_calls_used,
+            "sources_count": event.data.sources_count,
+            "output_length": len(event.data.research_output),
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Task Completed",
-                "message": f"Completed: {event.data.get('task_description', 'Task')}",
+                "message": f"Completed: {event.data.task_description}",
                 "status": "completed",
                 "progress": 100,
                 "show_in_timeline": True,
@@ -225,9 +225,9 @@ class ResearchTaskWebSocketHandler(EventHandler):
                 "timeline_color": "green",
                 "show_metrics": True,
                 "metrics": {
-                    "duration": f"{event.data.get('duration_seconds', 0):.1f}s",
-                    "tool_calls": event.data.get("tool_calls_used", 0),
-                    "sources": event.data.get("sources_count", 0)
+                    "duration": f"{event.data.duration_seconds:.1f}s",
+                    "tool_calls": event.data.tool_calls_used,
+                    "sources": event.data.sources_count
                 }
             }
         }
@@ -242,14 +242,14 @@ class ResearchTaskWebSocketHandler(EventHandler):
             "type": "task_failed",
             "session_id": session_id,
             "task_id": event.aggregate_id,
-            "task_description": event.data.get("task_description"),
-            "error_message": event.data.get("error_message"),
-            "error_type": event.data.get("error_type"),
-            "retry_count": event.data.get("retry_count", 0),
-            "timestamp": event.timestamp.isoformat(),
+            "task_description": event.data.task_description,
+            "error_message": event.data.error_message,
+            "error_type": event.data.error_type,
+            "retry_count": event.data.retry_count,
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Task Failed",
-                "message": f"Failed: {event.data.get('error_message', 'Unknown error')}",
+                "message": f"Failed: {event.data.error_message}",
                 "status": "error",
                 "progress": 0,
                 "show_in_timeline": True,
@@ -258,9 +258,9 @@ class ResearchTaskWebSocketHandler(EventHandler):
                 "show_notification": True,
                 "notification_type": "error",
                 "error_details": {
-                    "type": event.data.get("error_type"),
-                    "message": event.data.get("error_message"),
-                    "retry_count": event.data.get("retry_count", 0)
+                    "type": event.data.error_type,
+                    "message": event.data.error_message,
+                    "retry_count": event.data.retry_count
                 }
             }
         }
@@ -309,11 +309,12 @@ class ResearchProgressWebSocketHandler(EventHandler):
                 "session_id": session_id,
                 "task_id": task_id,
                 "progress_percentage": current_progress,
+                "progress_points": list(event.data.get("progress_points", ())),
                 "progress_message": event.data.get("progress_message"),
                 "current_action": event.data.get("current_action"),
                 "tools_used": event.data.get("tools_used", 0),
                 "sources_found": event.data.get("sources_found", 0),
-                "timestamp": event.timestamp.isoformat(),
+                "timestamp": event.timestamp_iso,
                 "ui": {
                     "title": "Research Progress",
                     "message": event.data.get("progress_message", "Research in progress..."),
@@ -365,7 +366,7 @@ class ResearchPlanningWebSocketHandler(EventHandler):
             "estimated_duration": event.data.get("estimated_duration_minutes"),
             "research_approach": event.data.get("research_approach"),
             "plan_summary": event.data.get("plan_summary"),
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Research Plan Generated",
                 "message": f"Generated plan with {event.data.get('total_tasks', 0)} tasks",
@@ -395,7 +396,7 @@ class ResearchPlanningWebSocketHandler(EventHandler):
             "sections_count": event.data.get("sections_count"),
             "sources_cited": event.data.get("sources_cited"),
             "quality_score": event.data.get("quality_score"),
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Research Report Generated",
                 "message": f"Generated report ({event.data.get('report_length', 0)} characters)",
@@ -450,7 +451,7 @@ class HumanFeedbackWebSocketHandler(EventHandler):
             "session_id": session_id,
             "plan_presentation": event.data.get("plan_presentation"),
             "revision_number": event.data.get("revision_number", 0),
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Human Feedback Required",
                 "message": "Please review the research plan and provide feedback",
@@ -479,7 +480,7 @@ class HumanFeedbackWebSocketHandler(EventHandler):
             "session_id": session_id,
             "feedback_type": event.data.get("feedback_type"),
             "revision_number": event.data.get("revision_number", 0),
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp_iso,
             "ui": {
                 "title": "Feedback Received",
                 "message": f"Feedback received: {event.data.get('feedback_type')}",
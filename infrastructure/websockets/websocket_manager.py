@@ -11,6 +11,7 @@ import logging
 from typing import Dict, Any, Set, Optional, List
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from fastapi import WebSocket, WebSocketDisconnect
 
 from langfuse import observe
@@ -37,8 +38,8 @@ class WebSocketConnection:
     session_id: str
     user_id: Optional[str] = None
     subscribed_events: Set[str] = field(default_factory=set)
-    connected_at: datetime = field(default_factory=datetime.now(timezone.utc))
-    last_activity: datetime = field(default_factory=datetime.now(timezone.utc))
+    connected_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
+    last_activity: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     
     def update_activity(self):
         """Update last activity timestamp"""
@@ -152,9 +153,13 @@ class ResearchWebSocketManager:
     
     async def send_to_connection(self, connection: WebSocketConnection, message: Dict[str, Any]):
         """Send a message to a specific connection"""
+        await self._send_text(connection, json.dumps(message))
+    
+    async def _send_text(self, connection: WebSocketConnection, text: str):
+        """Send an already serialized message to a specific connection"""
         try:
             connection.update_activity()
-            await connection.websocket.send_text(json.dumps(message))
+            await connection.websocket.send_text(text)
         except Exception as e:
             logger.warning(f"Failed to send message to connection {connection.session_id}: {e}")
             # Connection might be dead, will be cleaned up on next operation
@@ -164,8 +169,10 @@ class ResearchWebSocketManager:
         connections = self.connections.get(session_id, [])
         
         if connections:
+            # Serialize once for every connection in the session
+            text = json.dumps(message)
             tasks = [
-                self.send_to_connection(conn, message) 
+                self._send_text(conn, text) 
                 for conn in connections
             ]
             await asyncio.gather(*tasks, return_exceptions=True)
@@ -183,23 +190,26 @@ class ResearchWebSocketManager:
         ]
         
         if interested_connections:
-            message = self._event_to_websocket_message(event)
+            text = json.dumps(self._event_to_websocket_message(event))
             tasks = [
-                self.send_to_connection(conn, message) 
+                self._send_text(conn, text) 
                 for conn in interested_connections
             ]
             await asyncio.gather(*tasks, return_exceptions=True)
     
     async def broadcast_event(self, event: DomainEvent):
         """Broadcast an event to all interested connections"""
-        message = self._event_to_websocket_message(event)
+        # Serialized on the first interested connection and reused for the rest
+        text = None
         
         # Get all connections interested in this event type
         all_tasks = []
         for session_connections in self.connections.values():
             for conn in session_connections:
                 if event.event_type in conn.subscribed_events:
-                    all_tasks.append(self.send_to_connection(conn, message))
+                    if text is None:
+                        text = json.dumps(self._event_to_websocket_message(event))
+                    all_tasks.append(self._send_text(conn, text))
         
         if all_tasks:
             await asyncio.gather(*all_tasks, return_exceptions=True)
@@ -212,16 +222,16 @@ class ResearchWebSocketManager:
             "event_type": event.event_type,
             "event_name": event.event_name,
             "aggregate_id": event.aggregate_id,
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp_iso,
             "version": event.version,
-            "data": event.data,
+            "data": dict(event.data),
             "metadata": {
                 "correlation_id": event.metadata.correlation_id,
                 "user_id": event.metadata.user_id,
                 "session_id": event.metadata.session_id,
                 "source": event.metadata.source,
                 "priority": event.metadata.priority.value,
-                "tags": event.metadata.tags
+                "tags": dict(event.metadata.tags)
             }
         }
         
@@ -4,23 +4,35 @@ Test domain events implementation.
 This module tests the basic functionality of the domain events system.
 """
 
+import json
 import pytest
 import asyncio
 from datetime import datetime
+from types import SimpleNamespace
 from uuid import uuid4
 
 from domain.events.base import InMemoryEventBus, event_handler, EventPriority
 from domain.events.research_events import (
     ResearchSessionStarted,
     ResearchTaskStarted,
+    ResearchTaskProgress,
     ResearchTaskCompleted,
-    ResearchTaskFailed
+    ResearchTaskFailed,
+    ResearchSessionCompleted,
+    ResearchSessionCancelled
 )
 from domain.events.handlers.research_handlers import (
     ResearchProgressTracker,
     ResearchMetricsCollector,
     ResearchAuditLogger
 )
+from domain.events.handlers import langfuse_research_handlers
+from domain.events.handlers.langfuse_research_handlers import (
+    LangfuseResearchProgressTracker,
+    LangfuseResearchMetricsCollector
+)
+from infrastructure.events.progress_batcher import ProgressBatcher
+from infrastructure.events.simple_event_bus import QueuedEventBus
 
 
 @pytest.fixture
@@ -32,6 +44,35 @@ async def event_bus():
     await bus.stop()
 
 
+class StubLangfuse:
+    """Langfuse client stand-in that records every call made on it"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def auth_check(self):
+        return True
+    
+    def create_dataset_item(self, **kwargs):
+        self.calls.append(("create_dataset_item", kwargs))
+        return SimpleNamespace(id=f"item-{len(self.calls)}")
+    
+    def __getattr__(self, method):
+        return lambda **kwargs: self.calls.append((method, kwargs))
+    
+    def called(self, method):
+        """Return the keyword arguments of each call to the given method"""
+        return [kwargs for name, kwargs in self.calls if name == method]
+
+
+@pytest.fixture
+def stub_langfuse(monkeypatch):
+    """Point the Langfuse handlers at a recording stub client"""
+    client = StubLangfuse()
+    monkeypatch.setattr(langfuse_research_handlers, "_get_langfuse", lambda: client)
+    return client
+
+
 @pytest.fixture
 def sample_session_id():
     """Generate a sample session ID"""
@@ -135,6 +176,8 @@ async def test_research_task_lifecycle(event_bus, sample_session_id, sample_task
     assert audit_log[0]["event_type"] == "research.session.started"
     assert audit_log[1]["event_type"] == "research.task.started"
     assert audit_log[2]["event_type"] == "research.task.completed"
+    assert audit_log[2]["data"]["sources_count"] == 10
+    json.dumps(audit_log)  # entries are plain, persistable data
 
 
 @pytest.mark.asyncio
@@ -181,6 +224,11 @@ async def test_task_failure_handling(event_bus, sample_session_id, sample_task_i
     assert progress["tasks"][sample_task_id]["status"] == "failed"
     assert progress["tasks"][sample_task_id]["error_message"] == "Network timeout"
     
+    rollup = progress_tracker.get_task_rollup(sample_session_id)
+    assert rollup["status_counts"] == {"failed": 1}
+    assert rollup["average_task_duration"] == 10.0
+    assert rollup["total_tool_calls"] == 1
+    
     metrics = metrics_collector.get_metrics()
     assert metrics["failed_tasks"] == 1
     assert metrics["completed_tasks"] == 0
@@ -273,6 +321,297 @@ async def test_multiple_handlers_same_event(event_bus, sample_session_id):
     assert "handler2" in handler_calls
 
 
+@pytest.mark.asyncio
+async def test_progress_tracker_status_queries(event_bus):
+    """Test per-status queries over tracked sessions"""
+    
+    progress_tracker = ResearchProgressTracker()
+    event_bus.subscribe(progress_tracker)
+    
+    session_ids = [str(uuid4()) for _ in range(3)]
+    for session_id in session_ids:
+        await event_bus.publish(ResearchSessionStarted(
+            session_id=session_id,
+            project_id="proj-123",
+            query="Test query"
+        ))
+    
+    await event_bus.publish(ResearchSessionCompleted(
+        session_id=session_ids[1],
+        project_id="proj-123",
+        query="Test query",
+        total_tasks=0,
+        successful_tasks=0,
+        failed_tasks=0,
+        total_duration_seconds=12.0,
+        total_tool_calls=0,
+        final_report_length=100
+    ))
+    
+    assert progress_tracker.get_status_counts() == {"in_progress": 2, "completed": 1}
+    assert progress_tracker.get_sessions_by_status("completed") == [session_ids[1]]
+    assert progress_tracker.get_session_progress(session_ids[1])["status"] == "completed"
+    assert set(progress_tracker.get_all_sessions()) == set(session_ids)
+
+
+@pytest.mark.asyncio
+async def test_langfuse_progress_tracker_bookkeeping(
+    event_bus, stub_langfuse, sample_session_id, sample_task_id
+):
+    """Test Langfuse progress tracking and its inline span/trace updates"""
+    
+    tracker = LangfuseResearchProgressTracker()
+    event_bus.subscribe(tracker)
+    
+    await event_bus.publish(ResearchSessionStarted(
+        session_id=sample_session_id,
+        project_id="proj-123",
+        query="Test query",
+        user_id="user-456"
+    ))
+    await event_bus.publish(ResearchTaskStarted(
+        task_id=sample_task_id,
+        session_id=sample_session_id,
+        task_description="Research AI developments",
+        estimated_tool_calls=5
+    ))
+    
+    # Updates run inside the handler, before its observation ends
+    task_spans = stub_langfuse.called("update_current_span")
+    assert [span["name"] for span in task_spans] == ["task_started"]
+    assert task_spans[0]["metadata"]["task_id"] == sample_task_id
+    
+    await event_bus.publish(ResearchTaskCompleted(
+        task_id=sample_task_id,
+        session_id=sample_session_id,
+        task_description="Research AI developments",
+        research_output="Found 10 relevant sources about AI developments...",
+        duration_seconds=45.5,
+        tool_calls_used=3,
+        sources_count=10
+    ))
+    await event_bus.publish(ResearchSessionCompleted(
+        session_id=sample_session_id,
+        project_id="proj-123",
+        query="Test query",
+        total_tasks=1,
+        successful_tasks=1,
+        failed_tasks=0,
+        total_duration_seconds=60.0,
+        total_tool_calls=3,
+        final_report_length=1000
+    ))
+    
+    progress = tracker.get_session_progress(sample_session_id)
+    assert progress["status"] == "completed"
+    assert progress["total_tasks"] == 1
+    assert progress["completed_tasks"] == 1
+    assert progress["success_rate"] == 1.0
+    assert progress["metrics"]["total_tool_calls"] == 3
+    assert progress["tasks"][sample_task_id]["status"] == "completed"
+    assert progress["tasks"][sample_task_id]["sources_found"] == 10
+    assert set(tracker.get_all_sessions()) == {sample_session_id}
+    
+    assert [span["name"] for span in stub_langfuse.called("update_current_span")] == [
+        "task_started", "task_completed"
+    ]
+    # One trace update per event plus the session start and completion
+    assert len(stub_langfuse.called("update_current_trace")) == 6
+    assert [score["name"] for score in stub_langfuse.called("score_current_trace")] == [
+        "research_quality"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_langfuse_metrics_collector_bookkeeping(event_bus, stub_langfuse):
+    """Test Langfuse metrics collection and dataset item tracking"""
+    
+    collector = LangfuseResearchMetricsCollector()
+    event_bus.subscribe(collector)
+    
+    completed_id, cancelled_id = str(uuid4()), str(uuid4())
+    for session_id in (completed_id, cancelled_id):
+        await event_bus.publish(ResearchSessionStarted(
+            session_id=session_id,
+            project_id="proj-123",
+            query="Test query"
+        ))
+    
+    await event_bus.publish(ResearchTaskStarted(
+        task_id=str(uuid4()),
+        session_id=completed_id,
+        task_description="Failing task"
+    ))
+    await event_bus.publish(ResearchTaskFailed(
+        task_id=str(uuid4()),
+        session_id=completed_id,
+        task_description="Failing task",
+        error_message="Network timeout",
+        error_type="NetworkError",
+        duration_seconds=10.0,
+        tool_calls_made=2
+    ))
+    await event_bus.publish(ResearchSessionCompleted(
+        session_id=completed_id,
+        project_id="proj-123",
+        query="Test query",
+        total_tasks=1,
+        successful_tasks=0,
+        failed_tasks=1,
+        total_duration_seconds=30.0,
+        total_tool_calls=2,
+        final_report_length=0
+    ))
+    await event_bus.publish(ResearchSessionCancelled(
+        session_id=cancelled_id,
+        project_id="proj-123",
+        reason="User requested",
+        completed_tasks=0,
+        partial_duration_seconds=5.0
+    ))
+    
+    metrics = collector.get_metrics()
+    assert metrics["total_sessions"] == 2
+    assert metrics["completed_sessions"] == 1
+    assert metrics["cancelled_sessions"] == 1
+    assert metrics["total_tasks"] == 1
+    assert metrics["failed_tasks"] == 1
+    assert metrics["total_tool_calls"] == 2
+    assert metrics["average_session_duration"] == 30.0
+    
+    # Dataset items are created up front and keep their IDs for later updates
+    assert len(stub_langfuse.called("create_dataset_item")) == 2
+    assert collector.get_session_details(completed_id)["dataset_item_id"] is not None
+    assert collector.get_sessions_by_status("completed") == [completed_id]
+    assert collector.get_sessions_by_status("cancelled") == [cancelled_id]
+    assert set(collector.get_all_session_ids()) == {completed_id, cancelled_id}
+    assert collector.get_dataset_statistics()["status_breakdown"] == {
+        "completed": 1, "cancelled": 1
+    }
+
+@pytest.mark.asyncio
+async def test_publish_many_batches_per_handler(event_bus, sample_session_id):
+    """Test that publish_many hands each handler its events in order"""
+    
+    metrics_collector = ResearchMetricsCollector()
+    audit_logger = ResearchAuditLogger()
+    event_bus.subscribe(metrics_collector)
+    event_bus.subscribe(audit_logger)
+    
+    events = [
+        ResearchSessionStarted(
+            session_id=sample_session_id,
+            project_id="proj-123",
+            query="Test query"
+        ),
+        ResearchTaskStarted(
+            task_id="task-1",
+            session_id=sample_session_id,
+            task_description="Batched task"
+        ),
+        ResearchTaskFailed(
+            task_id="task-1",
+            session_id=sample_session_id,
+            task_description="Batched task",
+            error_message="Network timeout",
+            error_type="NetworkError",
+            duration_seconds=1.0,
+            tool_calls_made=2
+        )
+    ]
+    await event_bus.publish_many(events)
+    
+    metrics = metrics_collector.get_metrics()
+    assert metrics["total_sessions"] == 1
+    assert metrics["total_tasks"] == 1
+    assert metrics["failed_tasks"] == 1
+    assert metrics["total_tool_calls"] == 2
+    assert metrics["last_updated"] is not None
+    
+    audit_log = audit_logger.get_session_audit_log(sample_session_id)
+    assert [entry["event_type"] for entry in audit_log] == [e.event_type for e in events]
+
+
+@pytest.mark.asyncio
+async def test_progress_batcher_coalesces_updates(event_bus, sample_session_id):
+    """Test that the progress batcher publishes only the latest update per task"""
+    
+    published = []
+    
+    @event_handler(ResearchTaskProgress)
+    async def record_progress(event):
+        published.append(event)
+    
+    event_bus.subscribe(record_progress)
+    batcher = ProgressBatcher(event_bus, interval_seconds=60)
+    
+    for percentage in (10, 20, 30):
+        await batcher.submit("task-1", sample_session_id, percentage, f"{percentage}% done")
+    await batcher.submit("task-2", sample_session_id, 50, "halfway", stage="searching")
+    assert published == []
+    
+    await batcher.flush()
+    assert [(e.aggregate_id, e.data["progress_percentage"]) for e in published] == [("task-1", 30), ("task-2", 50)]
+    assert published[0].data["progress_points"] == (10, 20, 30)
+    assert published[1].data["stage"] == "searching"
+    
+    # Completion bypasses the interval
+    await batcher.submit("task-1", sample_session_id, 100, "done")
+    assert published[-1].data["progress_percentage"] == 100
+    assert len(published) == 3
+
+
+@pytest.mark.asyncio
+async def test_queued_event_bus_delivers_off_publish_path(sample_session_id):
+    """Test that the queued bus returns from publish before delivery and keeps order"""
+    
+    audit_logger = ResearchAuditLogger()
+    bus = QueuedEventBus()
+    bus.subscribe(audit_logger)
+    await bus.start()
+    
+    await bus.publish(ResearchSessionStarted(
+        session_id=sample_session_id,
+        project_id="proj-123",
+        query="Test query"
+    ))
+    await bus.publish(ResearchTaskStarted(
+        task_id="task-1",
+        session_id=sample_session_id,
+        task_description="Queued task"
+    ))
+    assert audit_logger.get_session_audit_log(sample_session_id) == []
+    
+    await bus.join()
+    audit_log = audit_logger.get_session_audit_log(sample_session_id)
+    assert [entry["event_type"] for entry in audit_log] == ["research.session.started", "research.task.started"]
+    
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_metrics_last_updated_formatted_on_read(event_bus, sample_session_id):
+    """Test that last_updated is stored raw and only formatted by get_metrics()"""
+    
+    metrics_collector = ResearchMetricsCollector()
+    event_bus.subscribe(metrics_collector)
+    assert metrics_collector.get_metrics()["last_updated"] is None
+    
+    await event_bus.publish(ResearchSessionStarted(
+        session_id=sample_session_id,
+        project_id="proj-123",
+        query="Test query"
+    ))
+    
+    # handle() only stamps epoch seconds
+    assert isinstance(metrics_collector._metrics["last_updated"], float)
+    
+    last_updated = metrics_collector.get_metrics()["last_updated"]
+    assert isinstance(last_updated, str)
+    assert datetime.fromisoformat(last_updated).tzinfo is not None
+    assert dict(metrics_collector.get_metrics())["last_updated"] == last_updated
+
+
 if __name__ == "__main__":
     # Run a simple test
     async def simple_test():